@@ -4,20 +4,273 @@ PicoClawからLINEメッセージを送受信するスキル。
 LINE Messaging APIを使用してテキスト、画像、スタンプの送信に対応。
 """
 
-import json
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
 import logging
 import os
-from typing import Any, Optional
-
-import requests
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, fields
+from itertools import islice
+from typing import Any, BinaryIO, Optional, Union
+
+import httpx
+import ijson
+import orjson
 
 logger = logging.getLogger(__name__)
 
 LINE_API_BASE_URL = "https://api.line.me/v2/bot"
 
+# Multicast APIで1リクエストあたりに指定できる送信先の上限
+MULTICAST_MAX_RECIPIENTS = 500
 
-class LineMessengerSkill:
-    """LINE Messaging APIを利用してメッセージの送受信を行うスキル。
+# メッセージタイプごとに、解析結果へ追加するフィールドを抽出する関数
+_MESSAGE_FIELD_EXTRACTORS: dict[str, Callable[[dict], dict[str, Any]]] = {
+    "text": lambda m: {"text": m.get("text", "")},
+    "image": lambda m: {"content_id": m.get("id", "")},
+    "sticker": lambda m: {
+        "sticker_id": m.get("stickerId", ""),
+        "package_id": m.get("packageId", ""),
+    },
+}
+
+# 429/5xx応答時の再試行設定（Retry-Afterヘッダーがあればそちらを優先）
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# 同期版・非同期版クライアントで共通のコネクションプール設定
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+
+def _build_text_messages(message: str) -> list[dict[str, Any]]:
+    """テキストメッセージを検証し、送信用のメッセージオブジェクトを構築する。
+
+    Args:
+        message: 送信するテキストメッセージ。
+
+    Returns:
+        メッセージオブジェクトのリスト。
+
+    Raises:
+        ValueError: メッセージが空または5000文字を超える場合。
+    """
+    if not message:
+        raise ValueError("メッセージは空にできません。")
+    if len(message) > 5000:
+        raise ValueError(
+            f"メッセージが長すぎます（{len(message)}文字）。最大5000文字です。"
+        )
+
+    return [{"type": "text", "text": message}]
+
+
+def _build_image_messages(image_url: str) -> list[dict[str, Any]]:
+    """画像URLを検証し、送信用のメッセージオブジェクトを構築する。
+
+    Args:
+        image_url: 送信する画像のURL。
+
+    Returns:
+        メッセージオブジェクトのリスト。
+
+    Raises:
+        ValueError: URLがHTTPSでない場合。
+    """
+    if not image_url.startswith("https://"):
+        raise ValueError("画像URLはHTTPSである必要があります。")
+
+    return [
+        {
+            "type": "image",
+            "originalContentUrl": image_url,
+            "previewImageUrl": image_url,
+        }
+    ]
+
+
+@dataclass(slots=True, frozen=True)
+class ParsedEvent:
+    """receive_webhook が返す解析済みのWebhookイベント。
+
+    Attributes:
+        event_type: イベントタイプ（"message"など）。
+        user_id: 送信者のユーザーID。
+        reply_token: リプライトークン。
+        message_type: メッセージタイプ（メッセージイベントの場合）。
+        text: メッセージのテキスト（テキストメッセージの場合）。
+        content_id: コンテンツID（画像メッセージの場合）。
+        sticker_id: スタンプID（スタンプメッセージの場合）。
+        package_id: スタンプのパッケージID（スタンプメッセージの場合）。
+    """
+
+    event_type: str
+    user_id: str
+    reply_token: str
+    message_type: Optional[str] = None
+    text: Optional[str] = None
+    content_id: Optional[str] = None
+    sticker_id: Optional[str] = None
+    package_id: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """従来の辞書形式に変換する。値が None のフィールドは含めない。
+
+        Returns:
+            解析されたイベント情報の辞書。
+        """
+        return {
+            f.name: value
+            for f in fields(self)
+            if (value := getattr(self, f.name)) is not None
+        }
+
+
+def parse_webhook_body(raw: bytes) -> dict[str, Any]:
+    """Webhookのリクエストボディ（生のバイト列）をorjsonで辞書に変換する。
+
+    receive_webhook に渡す前の解析に使用する。署名検証を行う場合は、
+    解析前のバイト列を検証に使用すること。
+
+    Args:
+        raw: LINE Platformから受信したリクエストボディ。
+
+    Returns:
+        解析されたWebhookデータ。
+
+    Raises:
+        ValueError: ボディが正しいJSONでない場合。
+    """
+    return orjson.loads(raw)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """レスポンスを再試行すべきか判定し、再試行までの待機秒数を返す。
+
+    Args:
+        response: 直前のリクエストのレスポンス。
+        attempt: これまでの再試行回数（初回は0）。
+
+    Returns:
+        再試行までの待機秒数。再試行しない場合は None。
+    """
+    if attempt >= MAX_RETRIES or response.status_code not in RETRY_STATUS_CODES:
+        return None
+
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    return RETRY_BACKOFF_FACTOR * (2**attempt)
+
+
+def _chunked(items: Iterable[str], size: int) -> Iterator[list[str]]:
+    """イテラブルを最大 size 件ずつのリストに分割する。
+
+    Args:
+        items: 分割する要素。
+        size: 1チャンクあたりの最大件数。
+
+    Yields:
+        最大 size 件の要素を含むリスト。
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _merge_multicast_results(
+    chunks: list[list[str]], results: list[dict]
+) -> dict:
+    """チャンクごとのMulticast送信結果を1つの結果にまとめる。
+
+    Args:
+        chunks: 送信先ユーザーIDのチャンクのリスト。
+        results: 各チャンクの送信結果。chunks と同じ順序。
+
+    Returns:
+        送信結果を含む辞書。
+        成功時: {"status": "ok"}
+        失敗時: {"status": "error", "error": "...", "details": {...},
+                 "failed_recipients": [...]}
+    """
+    failed_recipients: list[str] = []
+    first_error: Optional[dict] = None
+    for chunk, result in zip(chunks, results):
+        if result["status"] != "ok":
+            failed_recipients.extend(chunk)
+            first_error = first_error or result
+
+    if first_error is None:
+        return {"status": "ok"}
+
+    return {
+        "status": "error",
+        "error": first_error["error"],
+        "details": first_error.get("details", {}),
+        "failed_recipients": failed_recipients,
+    }
+
+
+def _build_headers(channel_access_token: str) -> dict[str, str]:
+    """API呼び出しに共通のリクエストヘッダーを構築する。
+
+    Args:
+        channel_access_token: LINEチャネルアクセストークン。
+
+    Returns:
+        リクエストヘッダーの辞書。
+    """
+    return {
+        "Authorization": f"Bearer {channel_access_token}",
+        "Content-Type": "application/json",
+    }
+
+
+# チャネルアクセストークンごとに共有する同期クライアント。
+# 同じプロセス内の複数インスタンスでkeep-alive接続を再利用するため。
+_SHARED_CLIENTS: dict[str, httpx.Client] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_shared_client(channel_access_token: str) -> httpx.Client:
+    """チャネルアクセストークンに対応する共有クライアントを取得する。
+
+    初回呼び出し時にクライアントを作成する。HTTP/2で複数の送信を
+    1本のコネクションに多重化し、接続エラーはトランスポート層で再試行する
+    （429/5xxの再試行は _post_message で行う）。
+
+    Args:
+        channel_access_token: LINEチャネルアクセストークン。
+
+    Returns:
+        認証ヘッダー設定済みのクライアント。
+    """
+    client = _SHARED_CLIENTS.get(channel_access_token)
+    if client is not None:
+        return client
+
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(channel_access_token)
+        if client is None:
+            client = httpx.Client(
+                headers=_build_headers(channel_access_token),
+                timeout=30.0,
+                transport=httpx.HTTPTransport(
+                    http2=True, limits=_HTTP_LIMITS, retries=MAX_RETRIES
+                ),
+            )
+            _SHARED_CLIENTS[channel_access_token] = client
+        return client
+
+
+class _BaseLineMessengerSkill:
+    """同期版・非同期版のLINEスキルで共通の処理をまとめた基底クラス。
 
     Attributes:
         channel_access_token: LINEチャネルアクセストークン。
@@ -29,7 +282,7 @@ class LineMessengerSkill:
         channel_access_token: Optional[str] = None,
         channel_secret: Optional[str] = None,
     ) -> None:
-        """LineMessengerSkillを初期化する。
+        """認証情報を解決する。
 
         Args:
             channel_access_token: LINEチャネルアクセストークン。
@@ -51,48 +304,67 @@ class LineMessengerSkill:
                 "LINE_CHANNEL_ACCESS_TOKEN で指定してください。"
             )
 
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Authorization": f"Bearer {self.channel_access_token}",
-                "Content-Type": "application/json",
-            }
-        )
+        # 署名検証のたびにエンコードしないよう、バイト列で保持しておく
+        self._secret_bytes = (self.channel_secret or "").encode()
 
-    def _send_push_message(self, to: str, messages: list[dict[str, Any]]) -> dict:
-        """LINE Push Message APIを呼び出してメッセージを送信する。
+    def verify_signature(self, body: bytes, signature: str) -> bool:
+        """Webhookリクエストの署名（X-Line-Signatureヘッダー）を検証する。
+
+        body にはJSONとして解析する前の生のリクエストボディを渡すこと。
+        解析後に再シリアライズしたデータでは署名が一致しない。
 
         Args:
-            to: 送信先のユーザーID。
-            messages: 送信するメッセージオブジェクトのリスト。
+            body: 受信したリクエストボディ（バイト列）。
+            signature: X-Line-Signature ヘッダーの値（Base64）。
 
         Returns:
-            送信結果を含む辞書。
+            署名が正しい場合は True。
 
         Raises:
-            requests.HTTPError: API呼び出しが失敗した場合。
+            ValueError: チャネルシークレットが設定されていない場合。
+
+        Example:
+            >>> if not skill.verify_signature(request_body, headers["X-Line-Signature"]):
+            ...     return 400
         """
-        url = f"{LINE_API_BASE_URL}/message/push"
-        payload = {
-            "to": to,
-            "messages": messages,
-        }
+        if not self._secret_bytes:
+            raise ValueError(
+                "署名検証にはチャネルシークレットが必要です。引数または環境変数 "
+                "LINE_CHANNEL_SECRET で指定してください。"
+            )
+
+        try:
+            expected = base64.b64decode(signature, validate=True)
+        except (binascii.Error, ValueError):
+            return False
+
+        digest = hmac.new(self._secret_bytes, body, hashlib.sha256).digest()
+        return hmac.compare_digest(expected, digest)
+
+    def _handle_response(self, response: httpx.Response, target: str) -> dict:
+        """メッセージ送信APIのレスポンスを送信結果の辞書に変換する。
 
+        Args:
+            response: APIのレスポンス。
+            target: ログに出力する送信先の表記。
+
+        Returns:
+            送信結果を含む辞書。
+        """
         try:
-            response = self._session.post(url, json=payload, timeout=30)
-            response.raise_for_status()
-            logger.info("メッセージを送信しました: to=%s", to)
-            return {"status": "ok"}
-        except requests.HTTPError as e:
+            # 409は同じリトライキーのリクエストが受理済み（再試行前に送信済み）であることを示す
+            if response.status_code != 409:
+                response.raise_for_status()
+        except httpx.HTTPStatusError as e:
             error_body = {}
             try:
-                error_body = e.response.json()
-            except (ValueError, AttributeError):
+                error_body = orjson.loads(response.content)
+            except ValueError:
                 pass
             logger.error(
                 "メッセージの送信に失敗しました: to=%s, status=%s, body=%s",
-                to,
-                e.response.status_code if e.response is not None else "N/A",
+                target,
+                response.status_code,
                 error_body,
             )
             return {
@@ -100,10 +372,229 @@ class LineMessengerSkill:
                 "error": str(e),
                 "details": error_body,
             }
-        except requests.RequestException as e:
+
+        logger.info("メッセージを送信しました: to=%s", target)
+        return {"status": "ok"}
+
+    def _parse_event(self, event: dict[str, Any]) -> ParsedEvent:
+        """1件のWebhookイベントを解析する。
+
+        Args:
+            event: LINE Platformから受信したイベント辞書。
+
+        Returns:
+            解析されたイベント。
+        """
+        event_type = event.get("type", "unknown")
+        user_id = (event.get("source") or {}).get("userId", "")
+
+        if event_type == "message":
+            message = event.get("message") or {}
+            message_type = message.get("type", "unknown")
+            extractor = _MESSAGE_FIELD_EXTRACTORS.get(message_type)
+            parsed_event = ParsedEvent(
+                event_type=event_type,
+                user_id=user_id,
+                reply_token=event.get("replyToken", ""),
+                message_type=message_type,
+                **(extractor(message) if extractor else {}),
+            )
+        else:
+            parsed_event = ParsedEvent(
+                event_type=event_type,
+                user_id=user_id,
+                reply_token=event.get("replyToken", ""),
+            )
+
+        logger.info(
+            "イベントを解析しました: type=%s, user_id=%s",
+            event_type,
+            user_id,
+        )
+        return parsed_event
+
+    def stream_events(self, raw_stream: BinaryIO) -> Iterator[ParsedEvent]:
+        """Webhookのリクエストボディをストリームとして読みながらイベントを解析する。
+
+        ボディ全体をメモリに展開せず、"events" 配列の要素を1件ずつ解析して返す。
+        大量のイベントがまとめて送られてくる場合のメモリ使用量を抑えられる。
+
+        Args:
+            raw_stream: リクエストボディを読み出せるバイナリストリーム。
+
+        Yields:
+            解析されたイベント。解析に失敗したイベントはスキップする。
+        """
+        for event in ijson.items(raw_stream, "events.item"):
+            try:
+                yield self._parse_event(event)
+            except Exception as e:
+                logger.error("イベントの解析に失敗しました: %s", e)
+
+    def iter_events(
+        self, data: dict, *, types: Optional[set[str]] = None
+    ) -> Iterator[dict[str, Any]]:
+        """Webhookデータのイベントを解析せずに順に返す。
+
+        必要なイベントだけを後から解析したい場合に使用する。
+
+        Args:
+            data: LINE PlatformからのWebhookリクエストボディ。
+            types: 対象とするイベントタイプの集合（例: {"message"}）。
+                省略時はすべてのイベントを返す。
+
+        Yields:
+            LINE Platformから受信したままのイベント辞書。
+        """
+        for event in data.get("events", ()):
+            if types and event.get("type") not in types:
+                continue
+            yield event
+
+    def receive_webhook(
+        self,
+        data: dict,
+        *,
+        types: Optional[set[str]] = None,
+        deserialize: bool = True,
+    ) -> Union[list[ParsedEvent], list[dict[str, Any]]]:
+        """Webhookデータを受信して解析する。
+
+        LINE Platformから送られてくるWebhookイベントデータを解析し、
+        テキストメッセージイベントの情報を抽出して返す。
+
+        Args:
+            data: LINE PlatformからのWebhookリクエストボディ。
+                "events"キーにイベントのリストが含まれている必要がある。
+            types: 対象とするイベントタイプの集合。省略時はすべてのイベントを対象とする。
+            deserialize: False の場合、フィールドの抽出を行わず
+                受信したままのイベント辞書を返す。
+
+        Returns:
+            解析されたイベント（ParsedEvent）のリスト。
+            従来の辞書形式が必要な場合は ParsedEvent.to_dict() を使用する。
+
+        Example:
+            >>> webhook_data = {"events": [{"type": "message", ...}]}
+            >>> events = skill.receive_webhook(webhook_data)
+            >>> for event in events:
+            ...     print(event.text)
+        """
+        parsed_events = []
+        events = data.get("events", [])
+
+        if not events:
+            logger.warning("Webhookデータにイベントが含まれていません。")
+            return parsed_events
+
+        if not deserialize:
+            return list(self.iter_events(data, types=types))
+
+        for event in self.iter_events(data, types=types):
+            try:
+                parsed_events.append(self._parse_event(event))
+            except Exception as e:
+                logger.error("イベントの解析に失敗しました: %s", e)
+                continue
+
+        return parsed_events
+
+
+class LineMessengerSkill(_BaseLineMessengerSkill):
+    """LINE Messaging APIを利用してメッセージの送受信を行うスキル。
+
+    Attributes:
+        channel_access_token: LINEチャネルアクセストークン。
+        channel_secret: LINEチャネルシークレット。
+    """
+
+    def __init__(
+        self,
+        channel_access_token: Optional[str] = None,
+        channel_secret: Optional[str] = None,
+    ) -> None:
+        """LineMessengerSkillを初期化する。
+
+        Args:
+            channel_access_token: LINEチャネルアクセストークン。
+                省略時は環境変数 LINE_CHANNEL_ACCESS_TOKEN を使用。
+            channel_secret: LINEチャネルシークレット。
+                省略時は環境変数 LINE_CHANNEL_SECRET を使用。
+
+        Raises:
+            ValueError: チャネルアクセストークンが設定されていない場合。
+        """
+        super().__init__(channel_access_token, channel_secret)
+
+        self._session = _get_shared_client(self.channel_access_token)
+
+    def _post_message(
+        self, endpoint: str, payload: dict[str, Any], target: str
+    ) -> dict:
+        """Messaging APIのメッセージ送信エンドポイントを呼び出す。
+
+        Args:
+            endpoint: エンドポイント名（"push" や "multicast"）。
+            payload: リクエストボディ。
+            target: ログに出力する送信先の表記。
+
+        Returns:
+            送信結果を含む辞書。
+        """
+        url = f"{LINE_API_BASE_URL}/message/{endpoint}"
+
+        # 再試行しても重複送信されないよう、リクエストごとにリトライキーを付与する
+        headers = {"X-Line-Retry-Key": str(uuid.uuid4())}
+        body = orjson.dumps(payload)
+
+        try:
+            for attempt in range(MAX_RETRIES + 1):
+                response = self._session.post(url, content=body, headers=headers)
+                delay = _retry_delay(response, attempt)
+                if delay is None:
+                    break
+                time.sleep(delay)
+        except httpx.HTTPError as e:
             logger.error("ネットワークエラー: %s", e)
             return {"status": "error", "error": str(e)}
 
+        return self._handle_response(response, target)
+
+    def _send_push_message(self, to: str, messages: list[dict[str, Any]]) -> dict:
+        """LINE Push Message APIを呼び出してメッセージを送信する。
+
+        Args:
+            to: 送信先のユーザーID。
+            messages: 送信するメッセージオブジェクトのリスト。
+
+        Returns:
+            送信結果を含む辞書。
+        """
+        return self._post_message("push", {"to": to, "messages": messages}, to)
+
+    def _send_multicast_message(
+        self, to: list[str], messages: list[dict[str, Any]]
+    ) -> dict:
+        """LINE Multicast Message APIを呼び出して複数ユーザーに送信する。
+
+        送信先は MULTICAST_MAX_RECIPIENTS 件ずつに分割して送信する。
+
+        Args:
+            to: 送信先のユーザーIDのリスト。
+            messages: 送信するメッセージオブジェクトのリスト。
+
+        Returns:
+            送信結果を含む辞書。
+        """
+        chunks = list(_chunked(to, MULTICAST_MAX_RECIPIENTS))
+        results = [
+            self._post_message(
+                "multicast", {"to": chunk, "messages": messages}, f"{len(chunk)}件"
+            )
+            for chunk in chunks
+        ]
+        return _merge_multicast_results(chunks, results)
+
     def send_text(self, to: str, message: str) -> dict:
         """テキストメッセージを送信する。
 
@@ -125,15 +616,36 @@ class LineMessengerSkill:
             >>> print(result)
             {"status": "ok"}
         """
-        if not message:
-            raise ValueError("メッセージは空にできません。")
-        if len(message) > 5000:
-            raise ValueError(
-                f"メッセージが長すぎます（{len(message)}文字）。最大5000文字です。"
-            )
+        return self._send_push_message(to, _build_text_messages(message))
+
+    def send_text_multicast(self, to: list[str], message: str) -> dict:
+        """複数のユーザーに同じテキストメッセージを送信する。
+
+        Push Message APIを宛先ごとに呼び出す代わりに Multicast Message API を使い、
+        最大500件の宛先を1リクエストにまとめて送信する。
+
+        Args:
+            to: 送信先のユーザーIDのリスト。グループID・トークルームIDは指定不可。
+            message: 送信するテキストメッセージ。最大5000文字。
+
+        Returns:
+            送信結果を含む辞書。
+            成功時: {"status": "ok"}
+            失敗時: {"status": "error", "error": "...", "details": {...},
+                     "failed_recipients": [...]}
+
+        Raises:
+            ValueError: 送信先が空の場合、またはメッセージが不正な場合。
+
+        Example:
+            >>> result = skill.send_text_multicast(["U1234...", "U5678..."], "お知らせです")
+            >>> print(result)
+            {"status": "ok"}
+        """
+        if not to:
+            raise ValueError("送信先のユーザーIDを1件以上指定してください。")
 
-        messages = [{"type": "text", "text": message}]
-        return self._send_push_message(to, messages)
+        return self._send_multicast_message(to, _build_text_messages(message))
 
     def send_image(self, to: str, image_url: str) -> dict:
         """画像メッセージを送信する。
@@ -157,83 +669,188 @@ class LineMessengerSkill:
             >>> print(result)
             {"status": "ok"}
         """
-        if not image_url.startswith("https://"):
-            raise ValueError("画像URLはHTTPSである必要があります。")
+        return self._send_push_message(to, _build_image_messages(image_url))
 
-        messages = [
-            {
-                "type": "image",
-                "originalContentUrl": image_url,
-                "previewImageUrl": image_url,
-            }
-        ]
-        return self._send_push_message(to, messages)
 
-    def receive_webhook(self, data: dict) -> list[dict[str, Any]]:
-        """Webhookデータを受信して解析する。
+class AsyncLineMessengerSkill(_BaseLineMessengerSkill):
+    """LineMessengerSkillの非同期版。
 
-        LINE Platformから送られてくるWebhookイベントデータを解析し、
-        テキストメッセージイベントの情報を抽出して返す。
+    httpx.AsyncClient を共有し、複数の宛先への送信を
+    ``asyncio.gather`` で並行実行できる。``async with`` で使用する。
+
+    Example:
+        >>> async with AsyncLineMessengerSkill() as skill:
+        ...     results = await asyncio.gather(
+        ...         *(skill.send_text(uid, "お知らせです") for uid in user_ids)
+        ...     )
+    """
+
+    def __init__(
+        self,
+        channel_access_token: Optional[str] = None,
+        channel_secret: Optional[str] = None,
+    ) -> None:
+        """AsyncLineMessengerSkillを初期化する。
 
         Args:
-            data: LINE PlatformからのWebhookリクエストボディ。
-                "events"キーにイベントのリストが含まれている必要がある。
+            channel_access_token: LINEチャネルアクセストークン。
+                省略時は環境変数 LINE_CHANNEL_ACCESS_TOKEN を使用。
+            channel_secret: LINEチャネルシークレット。
+                省略時は環境変数 LINE_CHANNEL_SECRET を使用。
+
+        Raises:
+            ValueError: チャネルアクセストークンが設定されていない場合。
+        """
+        super().__init__(channel_access_token, channel_secret)
+        self._session: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "AsyncLineMessengerSkill":
+        self._session = httpx.AsyncClient(
+            headers=_build_headers(self.channel_access_token),
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True, limits=_HTTP_LIMITS, retries=MAX_RETRIES
+            ),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """セッションを閉じる。"""
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+
+    async def _post_message(
+        self, endpoint: str, payload: dict[str, Any], target: str
+    ) -> dict:
+        """Messaging APIのメッセージ送信エンドポイントを非同期で呼び出す。
+
+        Args:
+            endpoint: エンドポイント名（"push" や "multicast"）。
+            payload: リクエストボディ。
+            target: ログに出力する送信先の表記。
 
         Returns:
-            解析されたイベント情報の辞書のリスト。各辞書には以下のキーが含まれる:
-            - event_type (str): イベントタイプ（"message"など）
-            - message_type (str): メッセージタイプ（"text"など）
-            - text (str): メッセージのテキスト（テキストメッセージの場合）
-            - user_id (str): 送信者のユーザーID
-            - reply_token (str): リプライトークン
+            送信結果を含む辞書。
 
-        Example:
-            >>> webhook_data = {"events": [{"type": "message", ...}]}
-            >>> events = skill.receive_webhook(webhook_data)
-            >>> for event in events:
-            ...     print(event["text"])
+        Raises:
+            RuntimeError: ``async with`` の外で呼び出された場合。
         """
-        parsed_events = []
-        events = data.get("events", [])
+        if self._session is None:
+            raise RuntimeError(
+                "セッションが開始されていません。async with で使用してください。"
+            )
 
-        if not events:
-            logger.warning("Webhookデータにイベントが含まれていません。")
-            return parsed_events
+        url = f"{LINE_API_BASE_URL}/message/{endpoint}"
 
-        for event in events:
-            try:
-                event_type = event.get("type", "unknown")
-                source = event.get("source", {})
-                user_id = source.get("userId", "")
-                reply_token = event.get("replyToken", "")
-
-                parsed_event = {
-                    "event_type": event_type,
-                    "user_id": user_id,
-                    "reply_token": reply_token,
-                }
-
-                if event_type == "message":
-                    message = event.get("message", {})
-                    message_type = message.get("type", "unknown")
-                    parsed_event["message_type"] = message_type
-
-                    if message_type == "text":
-                        parsed_event["text"] = message.get("text", "")
-                    elif message_type == "image":
-                        parsed_event["content_id"] = message.get("id", "")
-                    elif message_type == "sticker":
-                        parsed_event["sticker_id"] = message.get("stickerId", "")
-                        parsed_event["package_id"] = message.get("packageId", "")
-
-                parsed_events.append(parsed_event)
-                logger.info(
-                    "イベントを解析しました: type=%s, user_id=%s",
-                    event_type,
-                    user_id,
+        headers = {"X-Line-Retry-Key": str(uuid.uuid4())}
+        body = orjson.dumps(payload)
+
+        try:
+            for attempt in range(MAX_RETRIES + 1):
+                response = await self._session.post(
+                    url, content=body, headers=headers
                 )
-            except Exception as e:
-                logger.error("イベントの解析に失敗しました: %s", e)
-                continue
+                delay = _retry_delay(response, attempt)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+        except httpx.HTTPError as e:
+            logger.error("ネットワークエラー: %s", e)
+            return {"status": "error", "error": str(e)}
 
-        return parsed_events
+        return self._handle_response(response, target)
+
+    async def _send_push_message(
+        self, to: str, messages: list[dict[str, Any]]
+    ) -> dict:
+        """LINE Push Message APIを非同期で呼び出してメッセージを送信する。
+
+        Args:
+            to: 送信先のユーザーID。
+            messages: 送信するメッセージオブジェクトのリスト。
+
+        Returns:
+            送信結果を含む辞書。
+        """
+        return await self._post_message(
+            "push", {"to": to, "messages": messages}, to
+        )
+
+    async def _send_multicast_message(
+        self, to: list[str], messages: list[dict[str, Any]]
+    ) -> dict:
+        """LINE Multicast Message APIを非同期で呼び出して複数ユーザーに送信する。
+
+        送信先は MULTICAST_MAX_RECIPIENTS 件ずつに分割し、各チャンクを並行して送信する。
+
+        Args:
+            to: 送信先のユーザーIDのリスト。
+            messages: 送信するメッセージオブジェクトのリスト。
+
+        Returns:
+            送信結果を含む辞書。
+        """
+        chunks = list(_chunked(to, MULTICAST_MAX_RECIPIENTS))
+        results = await asyncio.gather(
+            *(
+                self._post_message(
+                    "multicast",
+                    {"to": chunk, "messages": messages},
+                    f"{len(chunk)}件",
+                )
+                for chunk in chunks
+            )
+        )
+        return _merge_multicast_results(chunks, list(results))
+
+    async def send_text(self, to: str, message: str) -> dict:
+        """テキストメッセージを非同期で送信する。
+
+        Args:
+            to: 送信先のユーザーID。
+            message: 送信するテキストメッセージ。最大5000文字。
+
+        Returns:
+            送信結果を含む辞書。形式は LineMessengerSkill.send_text と同じ。
+
+        Raises:
+            ValueError: メッセージが空または5000文字を超える場合。
+        """
+        return await self._send_push_message(to, _build_text_messages(message))
+
+    async def send_text_multicast(self, to: list[str], message: str) -> dict:
+        """複数のユーザーに同じテキストメッセージを非同期で送信する。
+
+        Args:
+            to: 送信先のユーザーIDのリスト。グループID・トークルームIDは指定不可。
+            message: 送信するテキストメッセージ。最大5000文字。
+
+        Returns:
+            送信結果を含む辞書。形式は LineMessengerSkill.send_text_multicast と同じ。
+
+        Raises:
+            ValueError: 送信先が空の場合、またはメッセージが不正な場合。
+        """
+        if not to:
+            raise ValueError("送信先のユーザーIDを1件以上指定してください。")
+
+        return await self._send_multicast_message(to, _build_text_messages(message))
+
+    async def send_image(self, to: str, image_url: str) -> dict:
+        """画像メッセージを非同期で送信する。
+
+        Args:
+            to: 送信先のユーザーID。
+            image_url: 送信する画像のURL。HTTPS必須。
+
+        Returns:
+            送信結果を含む辞書。形式は LineMessengerSkill.send_image と同じ。
+
+        Raises:
+            ValueError: URLがHTTPSでない場合。
+        """
+        return await self._send_push_message(to, _build_image_messages(image_url))
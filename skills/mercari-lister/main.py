@@ -4,22 +4,47 @@
 商品写真から説明文を作成し、適切なカテゴリ・価格を提案。
 """
 
+import functools
 import logging
 import re
+import threading
+from collections.abc import Sequence
+from itertools import islice
 from typing import Any, Optional
 
+import ahocorasick
+import numpy as np
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - 未導入の環境では正規表現で判定する
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
-# 商品状態と価格倍率のマッピング
+# 商品状態と価格倍率のマッピング（最低倍率, 最高倍率, 平均倍率, 状態の説明文）
 CONDITION_PRICE_MULTIPLIER = {
-    "新品、未使用": {"min": 0.70, "max": 0.90, "label": "新品・未使用のため、大変綺麗な状態です。"},
-    "未使用に近い": {"min": 0.60, "max": 0.80, "label": "ほぼ未使用で、非常に良好な状態です。"},
-    "目立った傷や汚れなし": {"min": 0.40, "max": 0.70, "label": "目立った傷や汚れはなく、良好な状態です。"},
-    "やや傷や汚れあり": {"min": 0.30, "max": 0.50, "label": "多少の使用感はありますが、問題なくご使用いただけます。"},
-    "傷や汚れあり": {"min": 0.15, "max": 0.35, "label": "使用感がありますが、まだご使用いただけます。"},
-    "全体的に状態が悪い": {"min": 0.05, "max": 0.20, "label": "全体的に使用感がございます。ご理解の上ご購入ください。"},
+    "新品、未使用": (0.70, 0.90, 0.80, "新品・未使用のため、大変綺麗な状態です。"),
+    "未使用に近い": (0.60, 0.80, 0.70, "ほぼ未使用で、非常に良好な状態です。"),
+    "目立った傷や汚れなし": (0.40, 0.70, 0.55, "目立った傷や汚れはなく、良好な状態です。"),
+    "やや傷や汚れあり": (0.30, 0.50, 0.40, "多少の使用感はありますが、問題なくご使用いただけます。"),
+    "傷や汚れあり": (0.15, 0.35, 0.25, "使用感がありますが、まだご使用いただけます。"),
+    "全体的に状態が悪い": (0.05, 0.20, 0.125, "全体的に使用感がございます。ご理解の上ご購入ください。"),
 }
 
+# 未定義の状態に適用する価格倍率（説明文は generate_description で状態名から生成する）
+DEFAULT_CONDITION_MULTIPLIER = (0.30, 0.50, 0.40, "")
+
+# 一括価格計算用: 状態名から倍率テーブルの行番号への対応（未定義の状態は最終行）
+_CONDITION_INDEX = {condition: i for i, condition in enumerate(CONDITION_PRICE_MULTIPLIER)}
+_DEFAULT_CONDITION_INDEX = len(CONDITION_PRICE_MULTIPLIER)
+
+# 一括価格計算用の倍率テーブル（各行: 最低倍率, 最高倍率, 平均倍率）
+_MULTIPLIER_TABLE = np.array(
+    [values[:3] for values in CONDITION_PRICE_MULTIPLIER.values()]
+    + [DEFAULT_CONDITION_MULTIPLIER[:3]]
+)
+
 # 簡易カテゴリ推定用キーワードマッピング
 CATEGORY_KEYWORDS = {
     "レディース": ["レディース", "ワンピース", "スカート", "ブラウス", "パンプス"],
@@ -40,6 +65,87 @@ CATEGORY_KEYWORDS = {
     "その他": [],
 }
 
+# ハッシュタグに使う単語（2文字以上の英数字・かな・漢字）
+_HASHTAG_WORD_RE = re.compile(r"[A-Za-zぁ-んァ-ヶ一-龥0-9]{2,}")
+
+# カテゴリごとのキーワードを1つの正規表現にまとめたもの（大文字小文字を区別しない）
+_CATEGORY_PATTERNS = [
+    (category, re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE))
+    for category, keywords in CATEGORY_KEYWORDS.items()
+    if keywords
+]
+
+
+def _build_keyword_index() -> dict[str, int]:
+    """キーワード（casefold済み）から _CATEGORY_PATTERNS 内のカテゴリ位置への索引を構築する。
+
+    同じキーワードが複数カテゴリにある場合は先に定義されたカテゴリを優先する。
+
+    Returns:
+        キーワードからカテゴリ位置への辞書。
+    """
+    index: dict[str, int] = {}
+    for category_id, (category, _) in enumerate(_CATEGORY_PATTERNS):
+        for keyword in CATEGORY_KEYWORDS[category]:
+            index.setdefault(keyword.casefold(), category_id)
+    return index
+
+
+_KEYWORD_TO_CATEGORY_ID = _build_keyword_index()
+
+
+def _build_category_database() -> Optional["hyperscan.Database"]:
+    """全カテゴリのキーワードを1つのHyperscanデータベースにまとめる。
+
+    各キーワードのIDには _CATEGORY_PATTERNS 内のカテゴリ位置を割り当てる。
+    hyperscan が未導入の場合は None を返し、正規表現による判定にフォールバックする。
+
+    Returns:
+        コンパイル済みのデータベース。hyperscan が使えない場合は None。
+    """
+    if hyperscan is None:
+        return None
+
+    expressions = []
+    ids = []
+    for category_id, category in enumerate(c for c, _ in _CATEGORY_PATTERNS):
+        for keyword in CATEGORY_KEYWORDS[category]:
+            expressions.append(re.escape(keyword).encode())
+            ids.append(category_id)
+
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions,
+        ids=ids,
+        flags=[
+            hyperscan.HS_FLAG_CASELESS
+            | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_SINGLEMATCH
+        ]
+        * len(expressions),
+    )
+    return database
+
+
+# データベース自体は読み取り専用でスレッド間で共有できるが、走査に使う
+# スクラッチ領域は同時に使えない（使用中に走査すると ScratchInUseError となる）。
+# そのためスクラッチはスレッドごとに _category_scratch で確保する。
+_CATEGORY_DATABASE = _build_category_database()
+_CATEGORY_SCRATCH = threading.local()
+
+
+def _category_scratch() -> "hyperscan.Scratch":
+    """現在のスレッド専用のスクラッチ領域を返す。初回呼び出し時に確保する。
+
+    Returns:
+        _CATEGORY_DATABASE 用のスクラッチ領域。
+    """
+    scratch = getattr(_CATEGORY_SCRATCH, "scratch", None)
+    if scratch is None:
+        scratch = hyperscan.Scratch(_CATEGORY_DATABASE)
+        _CATEGORY_SCRATCH.scratch = scratch
+    return scratch
+
 # ブランド別の基準価格帯（簡易的な参考値）
 BRAND_BASE_PRICES = {
     "apple": 30000,
@@ -58,9 +164,206 @@ BRAND_BASE_PRICES = {
     "panasonic": 10000,
 }
 
+# 商品説明文のテンプレート（ブランドあり・なし）
+_DESCRIPTION_TEMPLATE_WITH_BRAND = """\
+【{brand}】{item_name}
+
+ご覧いただきありがとうございます。
+
+■ 商品名
+{item_name}
+
+■ ブランド
+{brand}
+
+■ 商品の状態
+{condition}
+
+■ 商品説明
+{brand}の{item_name}です。
+{condition_description}
+
+■ 発送について
+・匿名配送対応
+・24時間以内に発送予定
+・丁寧に梱包してお届けします
+
+{hashtag_text}"""
+
+_DESCRIPTION_TEMPLATE = """\
+{item_name}
+
+ご覧いただきありがとうございます。
+
+■ 商品名
+{item_name}
+
+■ 商品の状態
+{condition}
+
+■ 商品説明
+{item_name}です。
+{condition_description}
+
+■ 発送について
+・匿名配送対応
+・24時間以内に発送予定
+・丁寧に梱包してお届けします
+
+{hashtag_text}"""
+
 # デフォルトの基準価格
 DEFAULT_BASE_PRICE = 5000
 
+# メルカリの最低出品価格
+MIN_LISTING_PRICE = 300
+
+
+def _build_brand_automaton() -> ahocorasick.Automaton:
+    """商品名からブランドを1回の走査で検出するためのAho-Corasickオートマトンを構築する。
+
+    各ブランドには (定義順, 基準価格) を対応付ける。複数のブランドが含まれる場合に
+    BRAND_BASE_PRICES の定義順で先のものを優先できるようにするため。
+
+    Returns:
+        構築済みのオートマトン。
+    """
+    automaton = ahocorasick.Automaton()
+    for rank, (brand_key, price) in enumerate(BRAND_BASE_PRICES.items()):
+        automaton.add_word(brand_key, (rank, price))
+    automaton.make_automaton()
+    return automaton
+
+
+_BRAND_AUTOMATON = _build_brand_automaton()
+
+
+def _match_brand_price(text: str) -> Optional[int]:
+    """テキストに含まれるブランドの基準価格を返す。
+
+    Args:
+        text: 小文字化済みのテキスト。
+
+    Returns:
+        最初に定義されたブランドの基準価格。ブランドが含まれない場合は None。
+    """
+    matches = [value for _, value in _BRAND_AUTOMATON.iter(text)]
+    if matches:
+        return min(matches)[1]
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _lookup_base_price(item_lower: str, brand_folded: str) -> int:
+    """正規化済みの商品名とブランド名から基準価格を求める。
+
+    一括出品で同じ商品名が繰り返し渡されることを想定し、結果をキャッシュする。
+
+    Args:
+        item_lower: 小文字化した商品名。
+        brand_folded: casefold したブランド名。ブランドなしの場合は空文字。
+
+    Returns:
+        推定基準価格（円）。
+    """
+    price = _match_brand_price(brand_folded) if brand_folded else None
+
+    # 商品名からブランドを推定
+    if price is None:
+        price = _match_brand_price(item_lower)
+
+    return DEFAULT_BASE_PRICE if price is None else price
+
+
+@functools.lru_cache(maxsize=4096)
+def _lookup_category(search_text: str) -> str:
+    """検索テキストに含まれるキーワードからカテゴリを求める。
+
+    Args:
+        search_text: ブランド名と商品名を結合したテキスト。
+
+    Returns:
+        推定カテゴリ名。
+    """
+    # 単語がキーワードと完全一致するカテゴリを辞書引きで求める。
+    # 部分一致は拾えないため、これより前に定義されたカテゴリは引き続き照合が必要。
+    token_hit = min(
+        (
+            _KEYWORD_TO_CATEGORY_ID[token]
+            for token in _HASHTAG_WORD_RE.findall(search_text.casefold())
+            if token in _KEYWORD_TO_CATEGORY_ID
+        ),
+        default=len(_CATEGORY_PATTERNS),
+    )
+    if token_hit == 0:
+        return _CATEGORY_PATTERNS[0][0]
+
+    if _CATEGORY_DATABASE is not None:
+        # 全キーワードを1回の走査で照合し、定義順で最も先のカテゴリを採用する
+        matched_ids: list[int] = []
+        _CATEGORY_DATABASE.scan(
+            search_text.encode(),
+            match_event_handler=lambda id_, *_: matched_ids.append(id_),
+            scratch=_category_scratch(),
+        )
+        if matched_ids:
+            return _CATEGORY_PATTERNS[min(matched_ids)][0]
+        return "その他"
+
+    for category, pattern in _CATEGORY_PATTERNS[:token_hit]:
+        if pattern.search(search_text):
+            return category
+
+    if token_hit < len(_CATEGORY_PATTERNS):
+        return _CATEGORY_PATTERNS[token_hit][0]
+
+    return "その他"
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_description(
+    item_name: str, condition: str, brand: Optional[str], hashtag_text: str
+) -> str:
+    """説明文テンプレートに商品情報を埋め込む。
+
+    一括出品で同じ商品の説明文を繰り返し生成する場合に備えて、結果をキャッシュする。
+
+    Args:
+        item_name: 商品名。
+        condition: 商品の状態。
+        brand: ブランド名（任意）。
+        hashtag_text: 空白区切りのハッシュタグ。
+
+    Returns:
+        説明文全体。
+    """
+    _, _, _, condition_description = CONDITION_PRICE_MULTIPLIER.get(
+        condition, DEFAULT_CONDITION_MULTIPLIER
+    )
+    if not condition_description:
+        condition_description = f"{condition}の状態です。"
+
+    template = _DESCRIPTION_TEMPLATE_WITH_BRAND if brand else _DESCRIPTION_TEMPLATE
+    return template.format(
+        item_name=item_name,
+        brand=brand,
+        condition=condition,
+        condition_description=condition_description,
+        hashtag_text=hashtag_text,
+    )
+
+
+def _round_price(price: int) -> int:
+    """価格を100円単位に四捨五入する。最低価格は300円。
+
+    Args:
+        price: 価格（円）。
+
+    Returns:
+        丸めた価格（円）。
+    """
+    return max((price + 50) // 100 * 100, MIN_LISTING_PRICE)
+
 
 class MercariListerSkill:
     """メルカリ出品テキストを自動生成するスキル。
@@ -83,19 +386,7 @@ class MercariListerSkill:
         Returns:
             推定基準価格（円）。
         """
-        if brand:
-            brand_lower = brand.lower()
-            for brand_key, price in BRAND_BASE_PRICES.items():
-                if brand_key in brand_lower or brand_lower in brand_key:
-                    return price
-
-        # 商品名からブランドを推定
-        item_lower = item_name.lower()
-        for brand_key, price in BRAND_BASE_PRICES.items():
-            if brand_key in item_lower:
-                return price
-
-        return DEFAULT_BASE_PRICE
+        return _lookup_base_price(item_name.lower(), brand.casefold() if brand else "")
 
     def _estimate_category(self, item_name: str, brand: Optional[str] = None) -> str:
         """商品名とブランドからカテゴリを推定する。
@@ -111,12 +402,7 @@ class MercariListerSkill:
         if brand:
             search_text = f"{brand} {item_name}"
 
-        for category, keywords in CATEGORY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.lower() in search_text.lower():
-                    return category
-
-        return "その他"
+        return _lookup_category(search_text)
 
     def _generate_hashtags(
         self, item_name: str, brand: Optional[str] = None
@@ -136,9 +422,8 @@ class MercariListerSkill:
             hashtags.append(f"#{brand}")
 
         # 商品名からキーワードを抽出（2文字以上の単語）
-        words = re.findall(r"[A-Za-zぁ-んァ-ヶ一-龥0-9]{2,}", item_name)
-        for word in words[:3]:
-            tag = f"#{word}"
+        for match in islice(_HASHTAG_WORD_RE.finditer(item_name), 3):
+            tag = f"#{match.group()}"
             if tag not in hashtags:
                 hashtags.append(tag)
 
@@ -179,63 +464,8 @@ class MercariListerSkill:
         if not condition:
             raise ValueError("商品の状態は空にできません。")
 
-        condition_info = CONDITION_PRICE_MULTIPLIER.get(
-            condition,
-            {"label": f"{condition}の状態です。"},
-        )
-        condition_description = condition_info["label"]
-
         hashtags = self._generate_hashtags(item_name, brand)
-        hashtag_text = " ".join(hashtags)
-
-        # タイトル部分
-        if brand:
-            title = f"【{brand}】{item_name}"
-        else:
-            title = item_name
-
-        # テンプレートで説明文を組み立て
-        lines = [
-            title,
-            "",
-            "ご覧いただきありがとうございます。",
-            "",
-            "■ 商品名",
-            item_name,
-            "",
-        ]
-
-        if brand:
-            lines.extend(["■ ブランド", brand, ""])
-
-        lines.extend(
-            [
-                "■ 商品の状態",
-                condition,
-                "",
-                "■ 商品説明",
-            ]
-        )
-
-        if brand:
-            lines.append(f"{brand}の{item_name}です。")
-        else:
-            lines.append(f"{item_name}です。")
-
-        lines.extend(
-            [
-                condition_description,
-                "",
-                "■ 発送について",
-                "・匿名配送対応",
-                "・24時間以内に発送予定",
-                "・丁寧に梱包してお届けします",
-                "",
-                hashtag_text,
-            ]
-        )
-
-        text = "\n".join(lines)
+        text = _render_description(item_name, condition, brand, " ".join(hashtags))
 
         return {
             "text": text,
@@ -279,23 +509,18 @@ class MercariListerSkill:
 
         base_price = self._estimate_base_price(item_name)
 
-        condition_info = CONDITION_PRICE_MULTIPLIER.get(
-            condition,
-            {"min": 0.30, "max": 0.50},
+        min_multiplier, max_multiplier, avg_multiplier, _ = CONDITION_PRICE_MULTIPLIER.get(
+            condition, DEFAULT_CONDITION_MULTIPLIER
         )
 
-        min_multiplier = condition_info["min"]
-        max_multiplier = condition_info["max"]
-        avg_multiplier = (min_multiplier + max_multiplier) / 2
-
         min_price = int(base_price * min_multiplier)
         max_price = int(base_price * max_multiplier)
         suggested_price = int(base_price * avg_multiplier)
 
         # 100円単位に丸める
-        suggested_price = max(round(suggested_price / 100) * 100, 300)
-        min_price = max(round(min_price / 100) * 100, 300)
-        max_price = max(round(max_price / 100) * 100, 300)
+        suggested_price = _round_price(suggested_price)
+        min_price = _round_price(min_price)
+        max_price = _round_price(max_price)
 
         return {
             "suggested_price": suggested_price,
@@ -305,6 +530,70 @@ class MercariListerSkill:
             "condition_factor": f"状態「{condition}」による価格倍率: {min_multiplier:.0%}-{max_multiplier:.0%}",
         }
 
+    def suggest_price_batch(
+        self,
+        item_names: Sequence[str],
+        conditions: Sequence[str],
+    ) -> dict[str, np.ndarray]:
+        """複数商品の適正価格をまとめて計算する。
+
+        カタログ全体の価格付けなど、大量の商品を処理する場合に使用します。
+        基準価格の推定以外の計算はNumPyでベクトル化されており、
+        各商品の結果は suggest_price と同じになります。
+
+        Args:
+            item_names: 商品名のリスト。
+            conditions: 商品の状態のリスト。item_names と同じ長さ。
+
+        Returns:
+            価格提案情報を含む辞書。各値は商品ごとの整数配列:
+            - suggested_price: 推奨価格（円）
+            - min_price: 最低推奨価格（円）
+            - max_price: 最高推奨価格（円）
+            - base_price: 推定基準価格（円）
+
+        Raises:
+            ValueError: リストの長さが異なる場合、または商品名・状態に空のものがある場合。
+
+        Example:
+            >>> prices = skill.suggest_price_batch(
+            ...     ["AirPods Pro", "ナイキ スニーカー"],
+            ...     ["目立った傷や汚れなし", "やや傷や汚れあり"],
+            ... )
+            >>> print(prices["suggested_price"])
+        """
+        if len(item_names) != len(conditions):
+            raise ValueError("商品名と状態のリストは同じ長さである必要があります。")
+        if not all(item_names):
+            raise ValueError("商品名は空にできません。")
+        if not all(conditions):
+            raise ValueError("商品の状態は空にできません。")
+
+        count = len(item_names)
+        base_prices = np.fromiter(
+            (self._estimate_base_price(name) for name in item_names),
+            dtype=np.int64,
+            count=count,
+        )
+        condition_ids = np.fromiter(
+            (_CONDITION_INDEX.get(c, _DEFAULT_CONDITION_INDEX) for c in conditions),
+            dtype=np.intp,
+            count=count,
+        )
+
+        # 列: 最低・最高・平均。int() と同じく小数点以下を切り捨ててから100円単位に丸める
+        raw_prices = (base_prices[:, None] * _MULTIPLIER_TABLE[condition_ids]).astype(
+            np.int64
+        )
+        prices = np.maximum((raw_prices + 50) // 100 * 100, MIN_LISTING_PRICE)
+
+        return {
+            "suggested_price": prices[:, 2],
+            "min_price": prices[:, 0],
+            "max_price": prices[:, 1],
+            "base_price": base_prices,
+        }
+
     def generate_listing(
         self,
         item_name: str,
@@ -4,39 +4,218 @@
 データベースへのレコード追加、日報テンプレートの自動生成が可能。
 """
 
+import asyncio
+import copy
 import logging
 import os
-from datetime import date, datetime, timezone
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timezone
 from typing import Any, Optional
 
+import aiohttp
+import orjson
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 NOTION_API_BASE_URL = "https://api.notion.com/v1"
 NOTION_API_VERSION = "2022-06-28"
 
+# Notion APIのレート制限（平均3リクエスト/秒）に合わせた同時リクエスト数の上限
+NOTION_MAX_CONCURRENT_REQUESTS = 3
+
+# 1回のリクエストで送信できる子ブロック数の上限
+NOTION_MAX_BLOCKS_PER_REQUEST = 100
+
+# ブロック一覧取得時の1ページあたりの件数（APIの上限値）
+NOTION_PAGE_SIZE = 100
+
+# 同期版セッションの接続プールとリトライ設定
+HTTP_POOL_MAXSIZE = 32
+MAX_RETRIES = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# read_page のキャッシュ設定（有効期限の既定値は秒単位）
+DEFAULT_CACHE_TTL = 300
+CACHE_MAXSIZE = 512
+
+# 簡易Markdownの行頭記法。グループ名をそのままNotionのブロックタイプとして使う。
+# 番号付きリストは「数字で始まり、先頭4文字以内に ". " がある行」に一致する。
+# 「数字」は str.isdigit() と同じく上付き数字（"²"）や丸数字（"①"）も含むが、
+# 正規表現の \d はこれらに一致しないため、番号付きリストの選択肢は先頭文字を
+# 問わずに一致させ、呼び出し側で先頭文字を isdigit() で確認する。
+_LINE_RE = re.compile(
+    r"(?P<heading_3>### )"
+    r"|(?P<heading_2>## )"
+    r"|(?P<bulleted_list_item>- )"
+    r"|(?P<numbered_list_item>.{1,3}?\. )"
+)
+
+# Notionの日付プロパティとして扱う YYYY-MM-DD 形式。date.fromisoformat と同じく
+# ASCII数字のみを受け付ける（\d は全角数字などにも一致するため使わない）。
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])")
+
+# 日報の曜日表記（date.weekday() の 0=月曜 に対応）とテンプレート
+_WEEKDAYS = ("月", "火", "水", "木", "金", "土", "日")
+_DAILY_TEMPLATE = (
+    "## 日報 {date_str}（{weekday}）\n"
+    "\n"
+    "### 今日のタスク\n"
+    "- [ ] \n"
+    "- [ ] \n"
+    "- [ ] \n"
+    "\n"
+    "### 完了したタスク\n"
+    "- \n"
+    "\n"
+    "### 明日の予定\n"
+    "- \n"
+    "\n"
+    "### メモ・気づき\n"
+)
+
+# リクエスト送信・レスポンス解析で発生し得る例外（HTTPエラーステータスを除く）。
+# orjson はJSONの解析に失敗すると orjson.JSONDecodeError を送出する。
+_REQUEST_ERRORS = (requests.RequestException, orjson.JSONDecodeError)
+_AIOHTTP_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError)
+
+
+def _build_headers(api_key: str) -> dict[str, str]:
+    """Notion API呼び出しに使用する共通ヘッダーを構築する。
+
+    Args:
+        api_key: Notion Internal Integration Token。
 
-class NotionLiteSkill:
-    """軽量なNotion連携を提供するスキル。
+    Returns:
+        HTTPヘッダーの辞書。
+    """
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "Notion-Version": NOTION_API_VERSION,
+    }
 
-    Notion APIを使用して、ページの作成・読取、データベースへのレコード追加、
-    日報テンプレートの自動生成を行います。
 
-    Attributes:
+class _RateLimitRetry(Retry):
+    """GETのリトライに加え、レート制限（429）で拒否されたPOST/PATCHも再送するRetry。
+
+    429 はリクエストが処理されずに拒否されたことを示すため、再送しても
+    ページやブロックが重複して作成されることはない。それ以外のステータスでは
+    POST/PATCH は再送しない。
+    """
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if method in ("POST", "PATCH") and status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _build_http_adapter() -> HTTPAdapter:
+    """接続プールを拡張し、リトライを設定したHTTPAdapterを生成する。
+
+    リトライ上限に達した場合も最後のレスポンスをそのまま返し、
+    呼び出し側の raise_for_status でエラーとして扱う。
+
+    Returns:
+        requests.Session にマウントするHTTPAdapter。
+    """
+    retry = _RateLimitRetry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=HTTP_POOL_MAXSIZE,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+
+# APIキーごとに共有する同期セッション。
+# 同じプロセス内の複数インスタンスでkeep-alive接続を再利用するため。
+_SHARED_SESSIONS: dict[str, requests.Session] = {}
+_SHARED_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_shared_session(api_key: str) -> requests.Session:
+    """APIキーに対応する共有セッションを取得する。
+
+    初回呼び出し時に認証ヘッダーとHTTPAdapterを設定したセッションを作成する。
+
+    Args:
         api_key: Notion Internal Integration Token。
+
+    Returns:
+        認証ヘッダー設定済みのセッション。
     """
+    session = _SHARED_SESSIONS.get(api_key)
+    if session is not None:
+        return session
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
-        """NotionLiteSkillを初期化する。
+    with _SHARED_SESSIONS_LOCK:
+        session = _SHARED_SESSIONS.get(api_key)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(_build_headers(api_key))
+            session.mount("https://", _build_http_adapter())
+            _SHARED_SESSIONS[api_key] = session
+        return session
 
-        Args:
-            api_key: Notion Internal Integration Token。
-                省略時は環境変数 NOTION_API_KEY を使用。
 
-        Raises:
-            ValueError: APIキーが設定されていない場合。
-        """
+def _parse_error_body(content: bytes) -> Any:
+    """エラーレスポンスのボディをJSONとして解析する。
+
+    Returns:
+        解析結果。JSONとして解析できない場合や空の場合は空の辞書。
+    """
+    try:
+        return orjson.loads(content) or {}
+    except ValueError:
+        return {}
+
+
+def _safe_error_body(e: requests.HTTPError) -> Any:
+    """HTTPError に紐づくレスポンスのボディを解析する。"""
+    if e.response is None:
+        return {}
+    return _parse_error_body(e.response.content)
+
+
+class _NotionHTTPError(Exception):
+    """非同期クライアントでNotion APIがエラーステータスを返した場合の例外。
+
+    Attributes:
+        details: レスポンスボディ（JSONとして解析できない場合は空の辞書）。
+    """
+
+    def __init__(self, message: str, details: dict[str, Any]) -> None:
+        super().__init__(message)
+        self.details = details
+
+
+class _BaseNotionLiteSkill:
+    """同期版・非同期版で共通のペイロード構築・レスポンス解析処理。
+
+    Attributes:
+        api_key: Notion Internal Integration Token。
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
         self.api_key = api_key or os.environ.get("NOTION_API_KEY")
 
         if not self.api_key:
@@ -45,16 +224,39 @@ class NotionLiteSkill:
                 "NOTION_API_KEY で指定してください。"
             )
 
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "Notion-Version": NOTION_API_VERSION,
-            }
-        )
-
-    def _parse_rich_text(self, rich_text_array: list[dict]) -> str:
+        self._cache: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=cache_ttl)
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(page_id: str) -> str:
+        """ハイフンの有無によらず同じページを指すキャッシュキーを返す。"""
+        return page_id.replace("-", "")
+
+    def _get_cached_page(self, page_id: str) -> Optional[dict[str, Any]]:
+        """キャッシュ済みの read_page 結果を返す。未登録・期限切れの場合はNone。"""
+        with self._cache_lock:
+            cached = self._cache.get(self._cache_key(page_id))
+        # 呼び出し側での変更がキャッシュに波及しないようコピーを返す
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def _set_cached_page(self, page_id: str, result: dict[str, Any]) -> None:
+        """read_page の結果をキャッシュする。エラー結果はキャッシュしない。"""
+        if "error" in result:
+            return
+        with self._cache_lock:
+            self._cache[self._cache_key(page_id)] = copy.deepcopy(result)
+
+    def _invalidate_cached_page(self, page_id: str) -> None:
+        """指定したページのキャッシュを破棄する。"""
+        with self._cache_lock:
+            self._cache.pop(self._cache_key(page_id), None)
+
+    def clear_cache(self) -> None:
+        """read_page のキャッシュをすべて破棄する。"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _parse_rich_text(self, rich_text_array: list[dict[str, Any]]) -> str:
         """Notion のリッチテキスト配列からプレーンテキストを抽出する。
 
         Args:
@@ -63,9 +265,8 @@ class NotionLiteSkill:
         Returns:
             結合されたプレーンテキスト文字列。
         """
-        return "".join(
-            item.get("plain_text", "") for item in rich_text_array
-        )
+        # join は内部でリストを作るため、ジェネレーターよりリスト内包表記の方が速い
+        return "".join([item.get("plain_text", "") for item in rich_text_array])
 
     def _build_rich_text(self, text: str) -> list[dict[str, Any]]:
         """プレーンテキストからNotion のリッチテキストオブジェクトを構築する。
@@ -94,74 +295,313 @@ class NotionLiteSkill:
         Returns:
             Notion API形式のブロックオブジェクトの配列。
         """
-        blocks = []
+        blocks: list[dict[str, Any]] = []
+        append = blocks.append
+        match_line = _LINE_RE.match
 
+        # 行ごとの呼び出しを避けるため、リッチテキストは _build_rich_text と
+        # 同じ形のリテラルをその場で構築する
         for line in content.split("\n"):
             stripped = line.strip()
-            if not stripped:
-                # 空行もパラグラフとして追加
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "paragraph",
-                        "paragraph": {"rich_text": []},
-                    }
-                )
-            elif stripped.startswith("### "):
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "heading_3",
-                        "heading_3": {
-                            "rich_text": self._build_rich_text(stripped[4:])
-                        },
-                    }
-                )
-            elif stripped.startswith("## "):
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "heading_2",
-                        "heading_2": {
-                            "rich_text": self._build_rich_text(stripped[3:])
-                        },
-                    }
-                )
-            elif stripped.startswith("- "):
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "bulleted_list_item",
-                        "bulleted_list_item": {
-                            "rich_text": self._build_rich_text(stripped[2:])
-                        },
-                    }
-                )
-            elif len(stripped) > 2 and stripped[0].isdigit() and ". " in stripped[:5]:
-                # "1. " のような番号付きリスト
-                text = stripped.split(". ", 1)[1] if ". " in stripped else stripped
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "numbered_list_item",
-                        "numbered_list_item": {
-                            "rich_text": self._build_rich_text(text)
-                        },
-                    }
-                )
+            match = match_line(stripped)
+            if match and (
+                match.lastgroup != "numbered_list_item" or stripped[0].isdigit()
+            ):
+                block_type = match.lastgroup
+                rich_text = [
+                    {"type": "text", "text": {"content": stripped[match.end():]}}
+                ]
+            elif stripped:
+                block_type = "paragraph"
+                rich_text = [{"type": "text", "text": {"content": stripped}}]
             else:
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "paragraph",
-                        "paragraph": {
-                            "rich_text": self._build_rich_text(stripped)
-                        },
-                    }
-                )
+                # 空行もパラグラフとして追加
+                block_type = "paragraph"
+                rich_text = []
+
+            append(
+                {
+                    "object": "block",
+                    "type": block_type,
+                    block_type: {"rich_text": rich_text},
+                }
+            )
 
         return blocks
 
+    def _build_page_payload(
+        self,
+        parent_id: str,
+        title: str,
+        content: Optional[str],
+    ) -> tuple[dict[str, Any], list[list[dict[str, Any]]]]:
+        """ページ作成APIのリクエストボディを構築する。
+
+        Notion APIは1回のリクエストで最大100ブロックまでしか受け付けないため、
+        先頭の100ブロックのみリクエストボディに含め、残りは100ブロックずつの
+        チャンクに分割して返す。
+
+        Returns:
+            (リクエストボディ, ページ作成後に追加するブロックのチャンクのリスト) のタプル。
+
+        Raises:
+            ValueError: parent_id またはタイトルが空の場合。
+        """
+        if not parent_id:
+            raise ValueError("親ページIDは空にできません。")
+        if not title:
+            raise ValueError("ページタイトルは空にできません。")
+
+        payload: dict[str, Any] = {
+            "parent": {"page_id": parent_id},
+            "properties": {
+                "title": {
+                    "title": self._build_rich_text(title),
+                }
+            },
+        }
+
+        if not content:
+            return payload, []
+
+        blocks = self._content_to_blocks(content)
+        size = NOTION_MAX_BLOCKS_PER_REQUEST
+        payload["children"] = blocks[:size]
+        pending_chunks = [
+            blocks[i : i + size] for i in range(size, len(blocks), size)
+        ]
+        return payload, pending_chunks
+
+    def _build_page_result(
+        self,
+        page_data: dict[str, Any],
+        blocks_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """ページのメタデータとブロック一覧から読み取り結果を構築する。
+
+        Args:
+            page_data: ``/pages/{id}`` のレスポンス。
+            blocks_data: ``/blocks/{id}/children`` のレスポンス。
+
+        Returns:
+            title, content, last_edited, created_time を含む辞書。
+        """
+        # タイトルの抽出
+        properties = page_data.get("properties", {})
+        title = ""
+        for prop in properties.values():
+            if prop.get("type") == "title":
+                title = self._parse_rich_text(prop.get("title", []))
+                break
+
+        # ブロックからテキストを抽出
+        content_parts: list[str] = []
+        parse_rich_text = self._parse_rich_text
+        for block in blocks_data.get("results", []):
+            block_type = block.get("type", "")
+            block_content = block.get(block_type, {})
+            text = parse_rich_text(block_content.get("rich_text", []))
+
+            if block_type in ("heading_1", "heading_2", "heading_3"):
+                prefix = "#" * int(block_type[-1])
+                content_parts.append(f"{prefix} {text}")
+            elif block_type == "bulleted_list_item":
+                content_parts.append(f"- {text}")
+            elif block_type == "numbered_list_item":
+                content_parts.append(f"* {text}")
+            elif block_type == "to_do":
+                checked = block_content.get("checked", False)
+                marker = "[x]" if checked else "[ ]"
+                content_parts.append(f"- {marker} {text}")
+            elif text:
+                content_parts.append(text)
+
+        return {
+            "title": title,
+            "content": "\n".join(content_parts),
+            "last_edited": page_data.get("last_edited_time", ""),
+            "created_time": page_data.get("created_time", ""),
+        }
+
+    def _build_property(
+        self, value: Any, is_title: bool = False
+    ) -> dict[str, Any]:
+        """プロパティ値をNotion API形式のプロパティオブジェクトに変換する。
+
+        Args:
+            value: プロパティの値。
+            is_title: タイトルプロパティとして扱う場合True。
+
+        Returns:
+            Notion API形式のプロパティオブジェクト。
+        """
+        if is_title:
+            return {"title": self._build_rich_text(str(value))}
+
+        # bool は int のサブクラスのため先に判定する。IntEnum や numpy.float64 など
+        # int・float のサブクラスも number として扱い、orjson で直列化できるよう
+        # 組み込み型に変換する。
+        if isinstance(value, bool):
+            return {"checkbox": value}
+        if isinstance(value, int):
+            return {"number": int(value)}
+        if isinstance(value, float):
+            return {"number": float(value)}
+
+        text = str(value)
+        if self._is_date_string(text):
+            return {"date": {"start": text}}
+        return {"rich_text": self._build_rich_text(text)}
+
+    def _build_record_payload(
+        self,
+        database_id: str,
+        properties: dict[str, Any],
+        title_key: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """データベースレコード追加APIのリクエストボディを構築する。
+
+        Raises:
+            ValueError: database_id またはプロパティが空の場合、
+                または title_key が properties に含まれない場合。
+        """
+        if not database_id:
+            raise ValueError("データベースIDは空にできません。")
+        if not properties:
+            raise ValueError("プロパティは空にできません。")
+
+        if title_key is None:
+            # 省略時は最初のプロパティをタイトルとして扱う
+            title_key = next(iter(properties))
+        elif title_key not in properties:
+            raise ValueError(
+                f"タイトルのプロパティ '{title_key}' が properties に含まれていません。"
+            )
+
+        notion_properties = {
+            name: self._build_property(value, is_title=(name == title_key))
+            for name, value in properties.items()
+        }
+
+        return {
+            "parent": {"database_id": database_id},
+            "properties": notion_properties,
+        }
+
+    def _is_date_string(self, value: str) -> bool:
+        """文字列が日付形式（YYYY-MM-DD、ASCII数字のみ）かどうかを判定する。
+
+        Args:
+            value: 判定する文字列。
+
+        Returns:
+            日付形式の場合True。
+        """
+        if not _ISO_DATE_RE.fullmatch(value):
+            return False
+        # 2月30日のように存在しない日付は日付として扱わない
+        try:
+            date.fromisoformat(value)
+        except ValueError:
+            return False
+        return True
+
+    def _build_daily_report(
+        self, database_id: str
+    ) -> tuple[str, str, dict[str, Any]]:
+        """今日の日付で日報テンプレートとリクエストボディを構築する。
+
+        Returns:
+            (日付文字列, テンプレートのテキスト, リクエストボディ) のタプル。
+
+        Raises:
+            ValueError: database_id が空の場合。
+        """
+        if not database_id:
+            raise ValueError("データベースIDは空にできません。")
+
+        today = date.today()
+        date_str = today.strftime("%Y-%m-%d")
+        weekday = _WEEKDAYS[today.weekday()]
+
+        title = f"日報 {date_str}（{weekday}）"
+        template = _DAILY_TEMPLATE.format(date_str=date_str, weekday=weekday)
+
+        payload: dict[str, Any] = {
+            "parent": {"database_id": database_id},
+            "properties": {
+                "名前": {"title": self._build_rich_text(title)},
+                "日付": {"date": {"start": date_str}},
+            },
+            "children": self._content_to_blocks(template),
+        }
+
+        return date_str, template, payload
+
+
+class NotionLiteSkill(_BaseNotionLiteSkill):
+    """軽量なNotion連携を提供するスキル。
+
+    Notion APIを使用して、ページの作成・読取、データベースへのレコード追加、
+    日報テンプレートの自動生成を行います。
+
+    Attributes:
+        api_key: Notion Internal Integration Token。
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
+        """NotionLiteSkillを初期化する。
+
+        Args:
+            api_key: Notion Internal Integration Token。
+                省略時は環境変数 NOTION_API_KEY を使用。
+            cache_ttl: read_page の結果をキャッシュする秒数。0 でキャッシュ無効。
+
+        Raises:
+            ValueError: APIキーが設定されていない場合。
+        """
+        super().__init__(api_key, cache_ttl)
+
+        self._session = _get_shared_session(self.api_key)
+
+    def _get_json(
+        self, url: str, params: Optional[dict[str, Any]] = None
+    ) -> dict[str, Any]:
+        """GETリクエストを送信し、レスポンスのJSONを返す。
+
+        Raises:
+            requests.HTTPError: APIがエラーステータスを返した場合。
+            requests.RequestException: ネットワークエラーの場合。
+            orjson.JSONDecodeError: レスポンスがJSONとして解析できない場合。
+        """
+        response = self._session.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _get_all_blocks(self, page_id: str) -> dict[str, Any]:
+        """ページの子ブロックを、ページネーションをたどってすべて取得する。
+
+        Returns:
+            全ページ分のブロックを results に格納した辞書。
+
+        Raises:
+            requests.HTTPError: APIがエラーステータスを返した場合。
+            requests.RequestException: ネットワークエラーの場合。
+        """
+        url = f"{NOTION_API_BASE_URL}/blocks/{page_id}/children"
+        params: dict[str, Any] = {"page_size": NOTION_PAGE_SIZE}
+        data = self._get_json(url, params)
+        results = data.get("results", [])
+        while data.get("has_more") and data.get("next_cursor"):
+            params["start_cursor"] = data["next_cursor"]
+            data = self._get_json(url, params)
+            results.extend(data.get("results", []))
+        return {"results": results}
+
     def create_page(
         self,
         parent_id: str,
@@ -172,6 +612,7 @@ class NotionLiteSkill:
 
         指定した親ページの下に、新しい子ページを作成します。
         コンテンツは簡易Markdown記法に対応しています。
+        100ブロックを超えるコンテンツは、ページ作成後に100ブロックずつ追加します。
 
         Args:
             parent_id: 親ページのID（ハイフンなし32文字 or ハイフン付き36文字）。
@@ -183,6 +624,8 @@ class NotionLiteSkill:
             - page_id (str): 作成されたページのID
             - url (str): ページのURL
             - title (str): ページタイトル
+            ページ作成後のブロック追加に失敗した場合は、page_id と url に
+            作成済みのページの情報を含んだまま error が設定される。
 
         Raises:
             ValueError: parent_id またはタイトルが空の場合。
@@ -196,58 +639,54 @@ class NotionLiteSkill:
             ... )
             >>> print(result["url"])
         """
-        if not parent_id:
-            raise ValueError("親ページIDは空にできません。")
-        if not title:
-            raise ValueError("ページタイトルは空にできません。")
-
+        payload, pending_chunks = self._build_page_payload(parent_id, title, content)
         url = f"{NOTION_API_BASE_URL}/pages"
-
-        payload: dict[str, Any] = {
-            "parent": {"page_id": parent_id},
-            "properties": {
-                "title": {
-                    "title": self._build_rich_text(title),
-                }
-            },
-        }
-
-        if content:
-            payload["children"] = self._content_to_blocks(content)
+        # ブロックの追加中に失敗した場合も、作成済みのページIDを返す
+        page_id = ""
+        page_url = ""
 
         try:
-            response = self._session.post(url, json=payload, timeout=30)
+            response = self._session.post(
+                url, data=orjson.dumps(payload), timeout=30
+            )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             page_id = data.get("id", "")
             page_url = data.get("url", "")
 
+            # 追加はページ末尾に行われるため、順序を保つよう1チャンクずつ送信
+            blocks_url = f"{NOTION_API_BASE_URL}/blocks/{page_id}/children"
+            for chunk in pending_chunks:
+                response = self._session.patch(
+                    blocks_url,
+                    data=orjson.dumps({"children": chunk}),
+                    timeout=30,
+                )
+                response.raise_for_status()
+
             logger.info("ページを作成しました: id=%s, title=%s", page_id, title)
+            self._invalidate_cached_page(parent_id)
             return {
                 "page_id": page_id,
                 "url": page_url,
                 "title": title,
             }
         except requests.HTTPError as e:
-            error_body = {}
-            try:
-                error_body = e.response.json()
-            except (ValueError, AttributeError):
-                pass
+            error_body = _safe_error_body(e)
             logger.error("ページの作成に失敗しました: %s, body=%s", e, error_body)
             return {
-                "page_id": "",
-                "url": "",
+                "page_id": page_id,
+                "url": page_url,
                 "title": title,
                 "error": str(e),
                 "details": error_body,
             }
-        except requests.RequestException as e:
+        except _REQUEST_ERRORS as e:
             logger.error("ネットワークエラー: %s", e)
             return {
-                "page_id": "",
-                "url": "",
+                "page_id": page_id,
+                "url": page_url,
                 "title": title,
                 "error": str(e),
             }
@@ -257,6 +696,8 @@ class NotionLiteSkill:
 
         指定したページのメタデータとブロックコンテンツを取得します。
         ブロックのテキスト内容をプレーンテキストとして結合して返します。
+        100ブロックを超えるページは、ページネーションをたどってすべて取得します。
+        取得結果は cache_ttl 秒間キャッシュされます。
 
         Args:
             page_id: 読み取るページのID。
@@ -279,64 +720,26 @@ class NotionLiteSkill:
         if not page_id:
             raise ValueError("ページIDは空にできません。")
 
+        cached = self._get_cached_page(page_id)
+        if cached is not None:
+            return cached
+
+        page_url = f"{NOTION_API_BASE_URL}/pages/{page_id}"
+
         try:
-            # ページのメタデータを取得
-            page_url = f"{NOTION_API_BASE_URL}/pages/{page_id}"
-            page_response = self._session.get(page_url, timeout=30)
-            page_response.raise_for_status()
-            page_data = page_response.json()
-
-            # タイトルの抽出
-            properties = page_data.get("properties", {})
-            title = ""
-            for prop in properties.values():
-                if prop.get("type") == "title":
-                    title = self._parse_rich_text(prop.get("title", []))
-                    break
-
-            # ブロックコンテンツの取得
-            blocks_url = f"{NOTION_API_BASE_URL}/blocks/{page_id}/children"
-            blocks_response = self._session.get(blocks_url, timeout=30)
-            blocks_response.raise_for_status()
-            blocks_data = blocks_response.json()
-
-            # ブロックからテキストを抽出
-            content_parts = []
-            for block in blocks_data.get("results", []):
-                block_type = block.get("type", "")
-                block_content = block.get(block_type, {})
-                rich_text = block_content.get("rich_text", [])
-                text = self._parse_rich_text(rich_text)
-
-                if block_type in ("heading_1", "heading_2", "heading_3"):
-                    prefix = "#" * int(block_type[-1])
-                    content_parts.append(f"{prefix} {text}")
-                elif block_type == "bulleted_list_item":
-                    content_parts.append(f"- {text}")
-                elif block_type == "numbered_list_item":
-                    content_parts.append(f"* {text}")
-                elif block_type == "to_do":
-                    checked = block_content.get("checked", False)
-                    marker = "[x]" if checked else "[ ]"
-                    content_parts.append(f"- {marker} {text}")
-                elif text:
-                    content_parts.append(text)
-
-            content = "\n".join(content_parts)
+            # メタデータとブロックコンテンツは互いに独立しているため並行して取得
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                page_future = executor.submit(self._get_json, page_url)
+                blocks_future = executor.submit(self._get_all_blocks, page_id)
+                page_data = page_future.result()
+                blocks_data = blocks_future.result()
 
             logger.info("ページを読み取りました: id=%s", page_id)
-            return {
-                "title": title,
-                "content": content,
-                "last_edited": page_data.get("last_edited_time", ""),
-                "created_time": page_data.get("created_time", ""),
-            }
+            result = self._build_page_result(page_data, blocks_data)
+            self._set_cached_page(page_id, result)
+            return result
         except requests.HTTPError as e:
-            error_body = {}
-            try:
-                error_body = e.response.json()
-            except (ValueError, AttributeError):
-                pass
+            error_body = _safe_error_body(e)
             logger.error("ページの読み取りに失敗しました: %s, body=%s", e, error_body)
             return {
                 "title": "",
@@ -346,7 +749,7 @@ class NotionLiteSkill:
                 "error": str(e),
                 "details": error_body,
             }
-        except requests.RequestException as e:
+        except _REQUEST_ERRORS as e:
             logger.error("ネットワークエラー: %s", e)
             return {
                 "title": "",
@@ -360,6 +763,7 @@ class NotionLiteSkill:
         self,
         database_id: str,
         properties: dict[str, Any],
+        title_key: Optional[str] = None,
     ) -> dict[str, Any]:
         """データベースにレコードを追加する。
 
@@ -367,7 +771,9 @@ class NotionLiteSkill:
         プロパティ名と値の辞書を受け取り、Notion API形式に自動変換します。
 
         サポートされるプロパティ型:
-        - 文字列: title または rich_text として自動判定
+        - title_key のプロパティ: title として設定
+        - bool: checkbox 型として設定
+        - int / float: number 型として設定
         - 日付文字列（YYYY-MM-DD形式）: date 型として設定
         - その他: rich_text として設定
 
@@ -375,6 +781,8 @@ class NotionLiteSkill:
             database_id: 対象データベースのID。
             properties: プロパティ名と値の辞書。
                 例: {"名前": "田中太郎", "期限": "2025-12-31"}
+            title_key: タイトルとして扱うプロパティ名。
+                省略時は properties の最初のプロパティを使用。
 
         Returns:
             追加結果を含む辞書。以下のキーを含む:
@@ -382,7 +790,8 @@ class NotionLiteSkill:
             - url (str): レコードのURL
 
         Raises:
-            ValueError: database_id またはプロパティが空の場合。
+            ValueError: database_id またはプロパティが空の場合、
+                または title_key が properties に含まれない場合。
 
         Example:
             >>> result = skill.add_database_record(
@@ -391,65 +800,27 @@ class NotionLiteSkill:
             ... )
             >>> print(result["record_id"])
         """
-        if not database_id:
-            raise ValueError("データベースIDは空にできません。")
-        if not properties:
-            raise ValueError("プロパティは空にできません。")
-
+        payload = self._build_record_payload(database_id, properties, title_key)
         url = f"{NOTION_API_BASE_URL}/pages"
 
-        # プロパティをNotion API形式に変換
-        notion_properties = {}
-        first_property = True
-
-        for prop_name, prop_value in properties.items():
-            if first_property:
-                # 最初のプロパティをタイトルとして扱う
-                notion_properties[prop_name] = {
-                    "title": self._build_rich_text(str(prop_value)),
-                }
-                first_property = False
-            elif self._is_date_string(str(prop_value)):
-                notion_properties[prop_name] = {
-                    "date": {"start": str(prop_value)},
-                }
-            elif isinstance(prop_value, bool):
-                notion_properties[prop_name] = {
-                    "checkbox": prop_value,
-                }
-            elif isinstance(prop_value, (int, float)):
-                notion_properties[prop_name] = {
-                    "number": prop_value,
-                }
-            else:
-                notion_properties[prop_name] = {
-                    "rich_text": self._build_rich_text(str(prop_value)),
-                }
-
-        payload = {
-            "parent": {"database_id": database_id},
-            "properties": notion_properties,
-        }
-
         try:
-            response = self._session.post(url, json=payload, timeout=30)
+            response = self._session.post(
+                url, data=orjson.dumps(payload), timeout=30
+            )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             record_id = data.get("id", "")
             record_url = data.get("url", "")
 
             logger.info("レコードを追加しました: id=%s", record_id)
+            self._invalidate_cached_page(database_id)
             return {
                 "record_id": record_id,
                 "url": record_url,
             }
         except requests.HTTPError as e:
-            error_body = {}
-            try:
-                error_body = e.response.json()
-            except (ValueError, AttributeError):
-                pass
+            error_body = _safe_error_body(e)
             logger.error("レコードの追加に失敗しました: %s, body=%s", e, error_body)
             return {
                 "record_id": "",
@@ -457,7 +828,7 @@ class NotionLiteSkill:
                 "error": str(e),
                 "details": error_body,
             }
-        except requests.RequestException as e:
+        except _REQUEST_ERRORS as e:
             logger.error("ネットワークエラー: %s", e)
             return {
                 "record_id": "",
@@ -465,21 +836,6 @@ class NotionLiteSkill:
                 "error": str(e),
             }
 
-    def _is_date_string(self, value: str) -> bool:
-        """文字列が日付形式（YYYY-MM-DD）かどうかを判定する。
-
-        Args:
-            value: 判定する文字列。
-
-        Returns:
-            日付形式の場合True。
-        """
-        try:
-            datetime.strptime(value, "%Y-%m-%d")
-            return True
-        except ValueError:
-            return False
-
     def generate_daily_report(self, database_id: str) -> dict[str, Any]:
         """日報テンプレートを自動生成してデータベースに追加する。
 
@@ -507,56 +863,21 @@ class NotionLiteSkill:
             >>> result = skill.generate_daily_report("db_id")
             >>> print(f"日報を作成しました: {result['date']}")
         """
-        if not database_id:
-            raise ValueError("データベースIDは空にできません。")
-
-        today = date.today()
-        date_str = today.strftime("%Y-%m-%d")
-        weekday_names = ["月", "火", "水", "木", "金", "土", "日"]
-        weekday = weekday_names[today.weekday()]
-
-        title = f"日報 {date_str}（{weekday}）"
-
-        template_lines = [
-            f"## 日報 {date_str}（{weekday}）",
-            "",
-            "### 今日のタスク",
-            "- [ ] ",
-            "- [ ] ",
-            "- [ ] ",
-            "",
-            "### 完了したタスク",
-            "- ",
-            "",
-            "### 明日の予定",
-            "- ",
-            "",
-            "### メモ・気づき",
-            "",
-        ]
-        template = "\n".join(template_lines)
-
-        # まずデータベースにレコードを追加
+        date_str, template, payload = self._build_daily_report(database_id)
         url = f"{NOTION_API_BASE_URL}/pages"
 
-        payload: dict[str, Any] = {
-            "parent": {"database_id": database_id},
-            "properties": {
-                "名前": {"title": self._build_rich_text(title)},
-                "日付": {"date": {"start": date_str}},
-            },
-            "children": self._content_to_blocks(template),
-        }
-
         try:
-            response = self._session.post(url, json=payload, timeout=30)
+            response = self._session.post(
+                url, data=orjson.dumps(payload), timeout=30
+            )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             record_id = data.get("id", "")
             record_url = data.get("url", "")
 
             logger.info("日報を作成しました: id=%s, date=%s", record_id, date_str)
+            self._invalidate_cached_page(database_id)
             return {
                 "record_id": record_id,
                 "url": record_url,
@@ -564,11 +885,7 @@ class NotionLiteSkill:
                 "template": template,
             }
         except requests.HTTPError as e:
-            error_body = {}
-            try:
-                error_body = e.response.json()
-            except (ValueError, AttributeError):
-                pass
+            error_body = _safe_error_body(e)
             logger.error("日報の作成に失敗しました: %s, body=%s", e, error_body)
             return {
                 "record_id": "",
@@ -578,7 +895,286 @@ class NotionLiteSkill:
                 "error": str(e),
                 "details": error_body,
             }
-        except requests.RequestException as e:
+        except _REQUEST_ERRORS as e:
+            logger.error("ネットワークエラー: %s", e)
+            return {
+                "record_id": "",
+                "url": "",
+                "date": date_str,
+                "template": template,
+                "error": str(e),
+            }
+
+
+class AsyncNotionLiteSkill(_BaseNotionLiteSkill):
+    """NotionLiteSkillの非同期版。
+
+    aiohttp.ClientSession を共有し、複数ページの読み取りなどを
+    ``asyncio.gather`` で並行実行できる。``async with`` で使用する。
+    Notion APIのレート制限に合わせ、同時リクエスト数は
+    NOTION_MAX_CONCURRENT_REQUESTS に制限される。
+
+    Example:
+        >>> async with AsyncNotionLiteSkill() as skill:
+        ...     pages = await skill.read_pages(["page_id_1", "page_id_2"])
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
+        """AsyncNotionLiteSkillを初期化する。
+
+        Args:
+            api_key: Notion Internal Integration Token。
+                省略時は環境変数 NOTION_API_KEY を使用。
+            cache_ttl: read_page の結果をキャッシュする秒数。0 でキャッシュ無効。
+
+        Raises:
+            ValueError: APIキーが設定されていない場合。
+        """
+        super().__init__(api_key, cache_ttl)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncNotionLiteSkill":
+        self._session = aiohttp.ClientSession(
+            headers=_build_headers(self.api_key),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        self._semaphore = asyncio.Semaphore(NOTION_MAX_CONCURRENT_REQUESTS)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """セッションを閉じる。"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[dict[str, Any]] = None,
+        params: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Notion APIを呼び出し、レスポンスのJSONを返す。
+
+        Raises:
+            RuntimeError: ``async with`` の外で呼び出された場合。
+            _NotionHTTPError: APIがエラーステータスを返した場合。
+        """
+        if self._session is None or self._semaphore is None:
+            raise RuntimeError(
+                "AsyncNotionLiteSkill は async with 内で使用してください。"
+            )
+
+        async with self._semaphore:
+            async with self._session.request(
+                method,
+                url,
+                data=None if payload is None else orjson.dumps(payload),
+                params=params,
+            ) as response:
+                if response.status >= 400:
+                    raise _NotionHTTPError(
+                        f"{response.status} Error: {response.reason} "
+                        f"for url: {url}",
+                        _parse_error_body(await response.read()),
+                    )
+                return orjson.loads(await response.read())
+
+    async def create_page(
+        self,
+        parent_id: str,
+        title: str,
+        content: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """新しいページを作成する（NotionLiteSkill.create_page の非同期版）。"""
+        payload, pending_chunks = self._build_page_payload(parent_id, title, content)
+        url = f"{NOTION_API_BASE_URL}/pages"
+        page_id = ""
+        page_url = ""
+
+        try:
+            data = await self._request("POST", url, payload)
+
+            page_id = data.get("id", "")
+            page_url = data.get("url", "")
+
+            # 追加はページ末尾に行われるため、並行させず1チャンクずつ送信
+            blocks_url = f"{NOTION_API_BASE_URL}/blocks/{page_id}/children"
+            for chunk in pending_chunks:
+                await self._request("PATCH", blocks_url, {"children": chunk})
+
+            logger.info("ページを作成しました: id=%s, title=%s", page_id, title)
+            self._invalidate_cached_page(parent_id)
+            return {
+                "page_id": page_id,
+                "url": page_url,
+                "title": title,
+            }
+        except _NotionHTTPError as e:
+            logger.error("ページの作成に失敗しました: %s, body=%s", e, e.details)
+            return {
+                "page_id": page_id,
+                "url": page_url,
+                "title": title,
+                "error": str(e),
+                "details": e.details,
+            }
+        except _AIOHTTP_ERRORS as e:
+            logger.error("ネットワークエラー: %s", e)
+            return {
+                "page_id": page_id,
+                "url": page_url,
+                "title": title,
+                "error": str(e),
+            }
+
+    async def _get_all_blocks(self, page_id: str) -> dict[str, Any]:
+        """ページの子ブロックを、ページネーションをたどってすべて取得する。
+
+        次ページのカーソルは前ページのレスポンスで決まるため、順番に取得する。
+        """
+        url = f"{NOTION_API_BASE_URL}/blocks/{page_id}/children"
+        params: dict[str, Any] = {"page_size": NOTION_PAGE_SIZE}
+        data = await self._request("GET", url, params=params)
+        results = data.get("results", [])
+        while data.get("has_more") and data.get("next_cursor"):
+            params["start_cursor"] = data["next_cursor"]
+            data = await self._request("GET", url, params=params)
+            results.extend(data.get("results", []))
+        return {"results": results}
+
+    async def read_page(self, page_id: str) -> dict[str, Any]:
+        """ページの内容を読み取る（NotionLiteSkill.read_page の非同期版）。"""
+        if not page_id:
+            raise ValueError("ページIDは空にできません。")
+
+        cached = self._get_cached_page(page_id)
+        if cached is not None:
+            return cached
+
+        try:
+            page_data, blocks_data = await asyncio.gather(
+                self._request("GET", f"{NOTION_API_BASE_URL}/pages/{page_id}"),
+                self._get_all_blocks(page_id),
+            )
+
+            logger.info("ページを読み取りました: id=%s", page_id)
+            result = self._build_page_result(page_data, blocks_data)
+            self._set_cached_page(page_id, result)
+            return result
+        except _NotionHTTPError as e:
+            logger.error("ページの読み取りに失敗しました: %s, body=%s", e, e.details)
+            return {
+                "title": "",
+                "content": "",
+                "last_edited": "",
+                "created_time": "",
+                "error": str(e),
+                "details": e.details,
+            }
+        except _AIOHTTP_ERRORS as e:
+            logger.error("ネットワークエラー: %s", e)
+            return {
+                "title": "",
+                "content": "",
+                "last_edited": "",
+                "created_time": "",
+                "error": str(e),
+            }
+
+    async def read_pages(self, page_ids: list[str]) -> list[dict[str, Any]]:
+        """複数のページを並行して読み取る。
+
+        Args:
+            page_ids: 読み取るページIDのリスト。
+
+        Returns:
+            page_ids と同じ順序の読み取り結果のリスト。
+            各要素の形式は read_page と同じ。
+
+        Raises:
+            ValueError: 空のページIDが含まれる場合。
+
+        Example:
+            >>> pages = await skill.read_pages(["page_id_1", "page_id_2"])
+            >>> print([page["title"] for page in pages])
+        """
+        return list(
+            await asyncio.gather(*(self.read_page(page_id) for page_id in page_ids))
+        )
+
+    async def add_database_record(
+        self,
+        database_id: str,
+        properties: dict[str, Any],
+        title_key: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """データベースにレコードを追加する（NotionLiteSkill.add_database_record の非同期版）。"""
+        payload = self._build_record_payload(database_id, properties, title_key)
+        url = f"{NOTION_API_BASE_URL}/pages"
+
+        try:
+            data = await self._request("POST", url, payload)
+
+            record_id = data.get("id", "")
+            logger.info("レコードを追加しました: id=%s", record_id)
+            self._invalidate_cached_page(database_id)
+            return {
+                "record_id": record_id,
+                "url": data.get("url", ""),
+            }
+        except _NotionHTTPError as e:
+            logger.error("レコードの追加に失敗しました: %s, body=%s", e, e.details)
+            return {
+                "record_id": "",
+                "url": "",
+                "error": str(e),
+                "details": e.details,
+            }
+        except _AIOHTTP_ERRORS as e:
+            logger.error("ネットワークエラー: %s", e)
+            return {
+                "record_id": "",
+                "url": "",
+                "error": str(e),
+            }
+
+    async def generate_daily_report(self, database_id: str) -> dict[str, Any]:
+        """日報テンプレートを生成して追加する（NotionLiteSkill.generate_daily_report の非同期版）。"""
+        date_str, template, payload = self._build_daily_report(database_id)
+        url = f"{NOTION_API_BASE_URL}/pages"
+
+        try:
+            data = await self._request("POST", url, payload)
+
+            record_id = data.get("id", "")
+            logger.info("日報を作成しました: id=%s, date=%s", record_id, date_str)
+            self._invalidate_cached_page(database_id)
+            return {
+                "record_id": record_id,
+                "url": data.get("url", ""),
+                "date": date_str,
+                "template": template,
+            }
+        except _NotionHTTPError as e:
+            logger.error("日報の作成に失敗しました: %s, body=%s", e, e.details)
+            return {
+                "record_id": "",
+                "url": "",
+                "date": date_str,
+                "template": template,
+                "error": str(e),
+                "details": e.details,
+            }
+        except _AIOHTTP_ERRORS as e:
             logger.error("ネットワークエラー: %s", e)
             return {
                 "record_id": "",
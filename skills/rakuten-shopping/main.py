@@ -4,23 +4,190 @@
 カテゴリ別検索、価格帯フィルター、ポイント還元率の表示に対応。
 """
 
+import asyncio
+import copy
 import logging
 import os
+import threading
+import unicodedata
+from collections.abc import Hashable, Iterable
 from typing import Any, Optional
 
+import aiohttp
+import orjson
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 RAKUTEN_API_BASE_URL = "https://app.rakuten.co.jp/services/api"
 ICHIBA_SEARCH_ENDPOINT = f"{RAKUTEN_API_BASE_URL}/IchibaItem/Search/20220601"
 
+# elements パラメータで取得する出力項目。_parse_item などで参照する項目だけに絞り、
+# レスポンスの転送量とJSON解析のコストを削減する。
+_ITEM_ELEMENTS = (
+    "itemName",
+    "itemPrice",
+    "itemCode",
+    "itemUrl",
+    "shopName",
+    "shopUrl",
+    "mediumImageUrls",
+    "reviewAverage",
+    "reviewCount",
+    "pointRate",
+    "availability",
+)
+_SEARCH_ELEMENTS = ",".join(("count", "page", "pageCount", "hits") + _ITEM_ELEMENTS)
+_COMPARE_ELEMENTS = ",".join(_ITEM_ELEMENTS)
+_POINT_RATE_ELEMENTS = "itemName,itemPrice,pointRate,pointRateStartTime"
+
+# 同期版セッションの接続プールとリトライ設定
+HTTP_POOL_MAXSIZE = 32
+MAX_RETRIES = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# 楽天APIのレート制限（1アプリIDあたり約1リクエスト/秒）を超えにくいよう、
+# 非同期版の同時リクエスト数を制限する。超過した場合の429は再送で吸収する。
+RAKUTEN_MAX_CONCURRENT_REQUESTS = 2
+
+# search・compare_prices・get_point_rate のキャッシュ設定（有効期限の既定値は秒単位）
+DEFAULT_CACHE_TTL = 300
+CACHE_MAXSIZE = 512
+
+# リクエスト送信・レスポンス解析で発生し得る例外（HTTPエラーステータスを除く）。
+# orjson はJSONの解析に失敗すると orjson.JSONDecodeError を送出する。
+_REQUEST_ERRORS = (requests.RequestException, orjson.JSONDecodeError)
+_AIOHTTP_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError)
+
+
+def _build_http_adapter() -> HTTPAdapter:
+    """接続プールを拡張し、リトライを設定したHTTPAdapterを生成する。
+
+    楽天APIの呼び出しはすべてGETのため、レート制限（429）や
+    一時的なサーバーエラーは指数バックオフで再送する。リトライ上限に
+    達した場合も最後のレスポンスをそのまま返し、呼び出し側の
+    raise_for_status でエラーとして扱う。
+
+    Returns:
+        requests.Session にマウントするHTTPAdapter。
+    """
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=HTTP_POOL_MAXSIZE,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+
+# 全インスタンスで共有する同期セッション。楽天APIの認証情報はリクエストパラメータで
+# 渡すため、アプリケーションIDによらず1つのセッションでkeep-alive接続を再利用する。
+_SHARED_SESSION: Optional[requests.Session] = None
+_SHARED_SESSION_LOCK = threading.Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    """共有セッションを取得する。初回呼び出し時に作成する。
+
+    Returns:
+        HTTPAdapter設定済みのセッション。
+    """
+    global _SHARED_SESSION
 
-class RakutenShoppingSkill:
-    """楽天市場の商品検索・価格比較を行うスキル。
+    session = _SHARED_SESSION
+    if session is not None:
+        return session
 
-    楽天商品検索APIを利用して、商品の検索、価格比較、
-    ポイント還元率の確認を行います。
+    with _SHARED_SESSION_LOCK:
+        if _SHARED_SESSION is None:
+            session = requests.Session()
+            session.mount("https://", _build_http_adapter())
+            _SHARED_SESSION = session
+        return _SHARED_SESSION
+
+
+def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> Optional[float]:
+    """非同期版のレスポンスを再送すべきか判定し、再送までの待機秒数を返す。
+
+    同期版の _build_http_adapter と同じ条件（RETRY_STATUS_CODES、MAX_RETRIES回まで、
+    Retry-Afterヘッダーを優先）で判定する。
+
+    Args:
+        response: 直前のリクエストのレスポンス。
+        attempt: これまでの再送回数（初回は0）。
+
+    Returns:
+        再送までの待機秒数。再送しない場合は None。
+    """
+    if attempt >= MAX_RETRIES or response.status not in RETRY_STATUS_CODES:
+        return None
+
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    return RETRY_BACKOFF_FACTOR * (2**attempt)
+
+
+def _parse_items(raw_items: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """API レスポンスの商品データのリストを整形する。
+
+    商品ごとの関数呼び出しを避けるため、1つの内包表記で変換する。
+
+    Args:
+        raw_items: 楽天APIから返された生の商品データのリスト。
+
+    Returns:
+        整形済みの商品情報辞書のリスト。
+    """
+    return [
+        {
+            "name": raw_item.get("itemName", ""),
+            "price": raw_item.get("itemPrice", 0),
+            "item_code": raw_item.get("itemCode", ""),
+            "item_url": raw_item.get("itemUrl", ""),
+            "shop_name": raw_item.get("shopName", ""),
+            "shop_url": raw_item.get("shopUrl", ""),
+            "image_url": imgs[0]
+            if (imgs := raw_item.get("mediumImageUrls"))
+            else "",
+            "review_average": raw_item.get("reviewAverage", 0.0),
+            "review_count": raw_item.get("reviewCount", 0),
+            "point": raw_item.get("pointRate", 1),
+            "availability": raw_item.get("availability", 0) == 1,
+        }
+        for raw_item in raw_items
+    ]
+
+
+def _normalize_keyword(keyword: str) -> str:
+    """検索キーワードを正規化する。
+
+    全角・半角の違い（NFKC正規化）と、空白の種類・連続・前後の空白を吸収する。
+    "ｺｰﾋｰ豆　ｷﾞﾌﾄ" と "コーヒー豆 ギフト" は同じキーワードになる。
+    APIへの送信とキャッシュキーの両方に正規化後のキーワードを使うことで、
+    キャッシュされた結果は常に実際に送信した検索条件と一致する。
+
+    Args:
+        keyword: 検索キーワード。
+
+    Returns:
+        正規化されたキーワード。
+    """
+    return " ".join(unicodedata.normalize("NFKC", keyword).split())
+
+
+class _BaseRakutenShoppingSkill:
+    """同期版・非同期版で共通のパラメータ構築・レスポンス解析処理。
 
     Attributes:
         app_id: 楽天アプリケーションID。
@@ -31,18 +198,8 @@ class RakutenShoppingSkill:
         self,
         app_id: Optional[str] = None,
         affiliate_id: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
     ) -> None:
-        """RakutenShoppingSkillを初期化する。
-
-        Args:
-            app_id: 楽天アプリケーションID。
-                省略時は環境変数 RAKUTEN_APP_ID を使用。
-            affiliate_id: 楽天アフィリエイトID。
-                省略時は環境変数 RAKUTEN_AFFILIATE_ID を使用。
-
-        Raises:
-            ValueError: アプリケーションIDが設定されていない場合。
-        """
         self.app_id = app_id or os.environ.get("RAKUTEN_APP_ID")
         self.affiliate_id = affiliate_id or os.environ.get("RAKUTEN_AFFILIATE_ID")
 
@@ -52,22 +209,44 @@ class RakutenShoppingSkill:
                 "RAKUTEN_APP_ID で指定してください。"
             )
 
-        self._session = requests.Session()
+        # app_id・affiliate_id は初期化後に変わらないため、共通パラメータを一度だけ構築
+        self._base_params = {
+            "applicationId": self.app_id,
+            "format": "json",
+            "formatVersion": "2",
+        }
+        if self.affiliate_id:
+            self._base_params["affiliateId"] = self.affiliate_id
+
+        self._cache: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=cache_ttl)
+        self._cache_lock = threading.Lock()
+
+    def _get_cached(self, key: Hashable) -> Optional[dict[str, Any]]:
+        """キャッシュ済みの結果を返す。未登録・期限切れの場合はNone。"""
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        # 呼び出し側での変更がキャッシュに波及しないようコピーを返す
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def _set_cached(self, key: Hashable, result: dict[str, Any]) -> None:
+        """結果をキャッシュする。エラー結果はキャッシュしない。"""
+        if "error" in result:
+            return
+        with self._cache_lock:
+            self._cache[key] = copy.deepcopy(result)
+
+    def clear_cache(self) -> None:
+        """search・compare_prices・get_point_rate のキャッシュをすべて破棄する。"""
+        with self._cache_lock:
+            self._cache.clear()
 
     def _build_base_params(self) -> dict[str, str]:
         """API呼び出しに必要な基本パラメータを構築する。
 
         Returns:
-            基本パラメータの辞書。
+            基本パラメータの辞書（呼び出しごとに新しいコピー）。
         """
-        params = {
-            "applicationId": self.app_id,
-            "format": "json",
-            "formatVersion": "2",
-        }
-        if self.affiliate_id:
-            params["affiliateId"] = self.affiliate_id
-        return params
+        return self._base_params.copy()
 
     def _parse_item(self, raw_item: dict[str, Any]) -> dict[str, Any]:
         """API レスポンスの商品データを整形する。
@@ -78,22 +257,181 @@ class RakutenShoppingSkill:
         Returns:
             整形済みの商品情報辞書。
         """
+        return _parse_items((raw_item,))[0]
+
+    def _build_search_params(
+        self,
+        keyword: str,
+        category: Optional[str],
+        min_price: Optional[int],
+        max_price: Optional[int],
+    ) -> dict[str, str]:
+        """商品検索APIのリクエストパラメータを構築する。
+
+        Raises:
+            ValueError: キーワードが空（空白のみを含む）の場合、または価格帯の指定が不正な場合。
+        """
+        keyword = _normalize_keyword(keyword)
+        if not keyword:
+            raise ValueError("検索キーワードは空にできません。")
+
+        params = self._build_base_params()
+        params["keyword"] = keyword
+        params["hits"] = "30"
+        params["elements"] = _SEARCH_ELEMENTS
+
+        if category:
+            params["genreId"] = category
+        if min_price is not None:
+            if min_price < 0:
+                raise ValueError("最低価格は0以上で指定してください。")
+            params["minPrice"] = str(min_price)
+        if max_price is not None:
+            if max_price < 0:
+                raise ValueError("最高価格は0以上で指定してください。")
+            params["maxPrice"] = str(max_price)
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise ValueError("最低価格は最高価格以下で指定してください。")
+
+        return params
+
+    def _build_search_result(self, data: dict[str, Any]) -> dict[str, Any]:
+        """商品検索APIのレスポンスから検索結果を構築する。"""
+        items = _parse_items(data.get("Items", []))
+
+        return {
+            "items": items,
+            "total_count": data.get("count", 0),
+            "page_info": {
+                "page": data.get("page", 1),
+                "page_count": data.get("pageCount", 0),
+                "hits": data.get("hits", 0),
+            },
+        }
+
+    def _build_compare_params(self, keyword: str) -> dict[str, str]:
+        """価格比較用（価格の昇順）の検索パラメータを構築する。
+
+        Raises:
+            ValueError: キーワードが空（空白のみを含む）の場合。
+        """
+        keyword = _normalize_keyword(keyword)
+        if not keyword:
+            raise ValueError("検索キーワードは空にできません。")
+
+        params = self._build_base_params()
+        params["keyword"] = keyword
+        params["hits"] = "30"
+        params["sort"] = "+itemPrice"
+        params["elements"] = _COMPARE_ELEMENTS
+        return params
+
+    def _build_compare_result(self, data: dict[str, Any]) -> dict[str, Any]:
+        """商品検索APIのレスポンスから価格比較結果を構築する。"""
+        items = _parse_items(data.get("Items", []))
+
+        # 価格0（価格未設定）の商品を除いた最安値・最高値・合計を1回の走査で集計
+        lowest = highest = total = count = 0
+        for item in items:
+            price = item["price"]
+            if price <= 0:
+                continue
+            if count == 0 or price < lowest:
+                lowest = price
+            if price > highest:
+                highest = price
+            total += price
+            count += 1
+
         return {
-            "name": raw_item.get("itemName", ""),
-            "price": raw_item.get("itemPrice", 0),
-            "item_code": raw_item.get("itemCode", ""),
-            "item_url": raw_item.get("itemUrl", ""),
-            "shop_name": raw_item.get("shopName", ""),
-            "shop_url": raw_item.get("shopUrl", ""),
-            "image_url": (raw_item.get("mediumImageUrls") or [""])[0]
-            if raw_item.get("mediumImageUrls")
-            else "",
-            "review_average": raw_item.get("reviewAverage", 0.0),
-            "review_count": raw_item.get("reviewCount", 0),
-            "point": raw_item.get("pointRate", 1),
-            "availability": raw_item.get("availability", 0) == 1,
+            "items": items,
+            "lowest_price": lowest,
+            "highest_price": highest,
+            "average_price": round(total / count, 0) if count else 0,
+            "total_count": len(items),
         }
 
+    def _build_point_rate_params(self, item_code: str) -> dict[str, str]:
+        """ポイント情報取得用の検索パラメータを構築する。
+
+        Raises:
+            ValueError: 商品コードが空の場合。
+        """
+        if not item_code:
+            raise ValueError("商品コードは空にできません。")
+
+        params = self._build_base_params()
+        params["itemCode"] = item_code
+        params["elements"] = _POINT_RATE_ELEMENTS
+        return params
+
+    def _build_point_rate_result(self, data: dict[str, Any]) -> dict[str, Any]:
+        """商品検索APIのレスポンスからポイント還元情報を構築する。"""
+        items = data.get("Items", [])
+        if not items:
+            return {
+                "item_name": "",
+                "base_rate": 0,
+                "bonus_rate": 0,
+                "total_rate": 0,
+                "estimated_points": 0,
+                "error": "商品が見つかりませんでした。",
+            }
+
+        item = items[0]
+        base_rate = item.get("pointRate", 1)
+        bonus_rate = item.get("pointRateStartTime", 0)
+        # ボーナスポイントがある場合は pointRate に含まれるケースを考慮
+        if isinstance(bonus_rate, str):
+            bonus_rate = 0
+        total_rate = base_rate + bonus_rate
+
+        price = item.get("itemPrice", 0)
+        estimated_points = int(price * total_rate / 100)
+
+        return {
+            "item_name": item.get("itemName", ""),
+            "price": price,
+            "base_rate": base_rate,
+            "bonus_rate": bonus_rate,
+            "total_rate": total_rate,
+            "estimated_points": estimated_points,
+        }
+
+
+class RakutenShoppingSkill(_BaseRakutenShoppingSkill):
+    """楽天市場の商品検索・価格比較を行うスキル。
+
+    楽天商品検索APIを利用して、商品の検索、価格比較、
+    ポイント還元率の確認を行います。
+
+    Attributes:
+        app_id: 楽天アプリケーションID。
+        affiliate_id: 楽天アフィリエイトID（任意）。
+    """
+
+    def __init__(
+        self,
+        app_id: Optional[str] = None,
+        affiliate_id: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
+        """RakutenShoppingSkillを初期化する。
+
+        Args:
+            app_id: 楽天アプリケーションID。
+                省略時は環境変数 RAKUTEN_APP_ID を使用。
+            affiliate_id: 楽天アフィリエイトID。
+                省略時は環境変数 RAKUTEN_AFFILIATE_ID を使用。
+            cache_ttl: 検索結果・ポイント情報をキャッシュする秒数。0 でキャッシュ無効。
+
+        Raises:
+            ValueError: アプリケーションIDが設定されていない場合。
+        """
+        super().__init__(app_id, affiliate_id, cache_ttl)
+
+        self._session = _get_shared_session()
+
     def search(
         self,
         keyword: str,
@@ -104,7 +442,8 @@ class RakutenShoppingSkill:
         """楽天市場の商品を検索する。
 
         指定されたキーワード、カテゴリ、価格帯で楽天市場の商品を検索します。
-        結果は最大30件返却されます。
+        結果は最大30件返却されます。取得結果は cache_ttl 秒間キャッシュされ、
+        全角・半角や空白の違いのみのキーワードはキャッシュを共有します。
 
         Args:
             keyword: 検索キーワード。
@@ -119,55 +458,32 @@ class RakutenShoppingSkill:
             - page_info (dict): ページング情報
 
         Raises:
-            ValueError: キーワードが空の場合。
+            ValueError: キーワードが空（空白のみを含む）の場合。
 
         Example:
             >>> skill = RakutenShoppingSkill()
             >>> results = skill.search("コーヒー豆", min_price=1000, max_price=3000)
             >>> print(results["total_count"])
         """
-        if not keyword:
-            raise ValueError("検索キーワードは空にできません。")
+        params = self._build_search_params(keyword, category, min_price, max_price)
 
-        params = self._build_base_params()
-        params["keyword"] = keyword
-        params["hits"] = "30"
-
-        if category:
-            params["genreId"] = category
-        if min_price is not None:
-            if min_price < 0:
-                raise ValueError("最低価格は0以上で指定してください。")
-            params["minPrice"] = str(min_price)
-        if max_price is not None:
-            if max_price < 0:
-                raise ValueError("最高価格は0以上で指定してください。")
-            params["maxPrice"] = str(max_price)
-        if min_price is not None and max_price is not None and min_price > max_price:
-            raise ValueError("最低価格は最高価格以下で指定してください。")
+        cache_key = ("search", params["keyword"], category, min_price, max_price)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             response = self._session.get(
                 ICHIBA_SEARCH_ENDPOINT, params=params, timeout=30
             )
             response.raise_for_status()
-            data = response.json()
-
-            items = [self._parse_item(item) for item in data.get("Items", [])]
-
-            return {
-                "items": items,
-                "total_count": data.get("count", 0),
-                "page_info": {
-                    "page": data.get("page", 1),
-                    "page_count": data.get("pageCount", 0),
-                    "hits": data.get("hits", 0),
-                },
-            }
+            result = self._build_search_result(orjson.loads(response.content))
+            self._set_cached(cache_key, result)
+            return result
         except requests.HTTPError as e:
             logger.error("楽天API呼び出しに失敗しました: %s", e)
             return {"items": [], "total_count": 0, "page_info": {}, "error": str(e)}
-        except requests.RequestException as e:
+        except _REQUEST_ERRORS as e:
             logger.error("ネットワークエラー: %s", e)
             return {"items": [], "total_count": 0, "page_info": {}, "error": str(e)}
 
@@ -176,6 +492,7 @@ class RakutenShoppingSkill:
 
         指定したキーワードで検索し、結果を価格の昇順でソートして返します。
         ショップ名、価格、ポイント還元率を含む比較情報を提供します。
+        取得結果は search と同様にキャッシュされます。
 
         Args:
             keyword: 比較対象の商品キーワード。
@@ -188,38 +505,27 @@ class RakutenShoppingSkill:
             - average_price (float): 平均価格
 
         Raises:
-            ValueError: キーワードが空の場合。
+            ValueError: キーワードが空（空白のみを含む）の場合。
 
         Example:
             >>> comparison = skill.compare_prices("Nintendo Switch")
             >>> print(f"最安値: {comparison['lowest_price']}円")
         """
-        if not keyword:
-            raise ValueError("検索キーワードは空にできません。")
+        params = self._build_compare_params(keyword)
 
-        params = self._build_base_params()
-        params["keyword"] = keyword
-        params["hits"] = "30"
-        params["sort"] = "+itemPrice"
+        cache_key = ("compare", params["keyword"])
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             response = self._session.get(
                 ICHIBA_SEARCH_ENDPOINT, params=params, timeout=30
             )
             response.raise_for_status()
-            data = response.json()
-
-            items = [self._parse_item(item) for item in data.get("Items", [])]
-
-            prices = [item["price"] for item in items if item["price"] > 0]
-
-            return {
-                "items": items,
-                "lowest_price": min(prices) if prices else 0,
-                "highest_price": max(prices) if prices else 0,
-                "average_price": round(sum(prices) / len(prices), 0) if prices else 0,
-                "total_count": len(items),
-            }
+            result = self._build_compare_result(orjson.loads(response.content))
+            self._set_cached(cache_key, result)
+            return result
         except requests.HTTPError as e:
             logger.error("価格比較に失敗しました: %s", e)
             return {
@@ -230,7 +536,7 @@ class RakutenShoppingSkill:
                 "total_count": 0,
                 "error": str(e),
             }
-        except requests.RequestException as e:
+        except _REQUEST_ERRORS as e:
             logger.error("ネットワークエラー: %s", e)
             return {
                 "items": [],
@@ -246,6 +552,7 @@ class RakutenShoppingSkill:
 
         楽天市場の商品コードを指定して、その商品のポイント還元情報を取得します。
         通常ポイント、ボーナスポイント、合計ポイント倍率を返します。
+        取得結果は cache_ttl 秒間キャッシュされます。
 
         Args:
             item_code: 楽天商品コード（例: "shop_12345"）。
@@ -265,50 +572,232 @@ class RakutenShoppingSkill:
             >>> info = skill.get_point_rate("shop_12345")
             >>> print(f"合計ポイント倍率: {info['total_rate']}倍")
         """
-        if not item_code:
-            raise ValueError("商品コードは空にできません。")
+        params = self._build_point_rate_params(item_code)
 
-        params = self._build_base_params()
-        params["itemCode"] = item_code
+        cache_key = ("point_rate", item_code)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             response = self._session.get(
                 ICHIBA_SEARCH_ENDPOINT, params=params, timeout=30
             )
             response.raise_for_status()
-            data = response.json()
-
-            items = data.get("Items", [])
-            if not items:
-                return {
-                    "item_name": "",
-                    "base_rate": 0,
-                    "bonus_rate": 0,
-                    "total_rate": 0,
-                    "estimated_points": 0,
-                    "error": "商品が見つかりませんでした。",
-                }
-
-            item = items[0]
-            base_rate = item.get("pointRate", 1)
-            bonus_rate = item.get("pointRateStartTime", 0)
-            # ボーナスポイントがある場合は pointRate に含まれるケースを考慮
-            if isinstance(bonus_rate, str):
-                bonus_rate = 0
-            total_rate = base_rate + bonus_rate
-
-            price = item.get("itemPrice", 0)
-            estimated_points = int(price * total_rate / 100)
+            result = self._build_point_rate_result(orjson.loads(response.content))
+            self._set_cached(cache_key, result)
+            return result
+        except requests.HTTPError as e:
+            logger.error("ポイント情報の取得に失敗しました: %s", e)
+            return {
+                "item_name": "",
+                "base_rate": 0,
+                "bonus_rate": 0,
+                "total_rate": 0,
+                "estimated_points": 0,
+                "error": str(e),
+            }
+        except _REQUEST_ERRORS as e:
+            logger.error("ネットワークエラー: %s", e)
+            return {
+                "item_name": "",
+                "base_rate": 0,
+                "bonus_rate": 0,
+                "total_rate": 0,
+                "estimated_points": 0,
+                "error": str(e),
+            }
+
+
+class AsyncRakutenShoppingSkill(_BaseRakutenShoppingSkill):
+    """RakutenShoppingSkillの非同期版。
+
+    aiohttp.ClientSession を共有し、複数キーワードの検索を
+    ``asyncio.gather`` で並行実行できる。``async with`` で使用する。
+    楽天APIのレート制限に合わせ、同時リクエスト数は
+    RAKUTEN_MAX_CONCURRENT_REQUESTS に制限される。429や一時的なサーバーエラーは
+    同期版と同様に再送する。
+
+    Example:
+        >>> async with AsyncRakutenShoppingSkill() as skill:
+        ...     results = await skill.search_many(["コーヒー豆", "紅茶"])
+    """
+
+    def __init__(
+        self,
+        app_id: Optional[str] = None,
+        affiliate_id: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
+        """AsyncRakutenShoppingSkillを初期化する。
+
+        Args:
+            app_id: 楽天アプリケーションID。
+                省略時は環境変数 RAKUTEN_APP_ID を使用。
+            affiliate_id: 楽天アフィリエイトID。
+                省略時は環境変数 RAKUTEN_AFFILIATE_ID を使用。
+            cache_ttl: 検索結果・ポイント情報をキャッシュする秒数。0 でキャッシュ無効。
+
+        Raises:
+            ValueError: アプリケーションIDが設定されていない場合。
+        """
+        super().__init__(app_id, affiliate_id, cache_ttl)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncRakutenShoppingSkill":
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        self._semaphore = asyncio.Semaphore(RAKUTEN_MAX_CONCURRENT_REQUESTS)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """セッションを閉じる。"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get(self, params: dict[str, str]) -> dict[str, Any]:
+        """商品検索APIを呼び出し、レスポンスのJSONを返す。
+
+        レート制限（429）や一時的なサーバーエラーは、待機中に他のリクエストを
+        妨げないよう同時実行数の枠を返してから待機し、再送する。
 
+        Raises:
+            RuntimeError: ``async with`` の外で呼び出された場合。
+            aiohttp.ClientResponseError: APIがエラーステータスを返した場合。
+        """
+        if self._session is None or self._semaphore is None:
+            raise RuntimeError(
+                "AsyncRakutenShoppingSkill は async with 内で使用してください。"
+            )
+
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                async with self._session.get(
+                    ICHIBA_SEARCH_ENDPOINT, params=params
+                ) as response:
+                    delay = _retry_delay(response, attempt)
+                    if delay is None:
+                        response.raise_for_status()
+                        return orjson.loads(await response.read())
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def search(
+        self,
+        keyword: str,
+        category: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """楽天市場の商品を検索する（RakutenShoppingSkill.search の非同期版）。"""
+        params = self._build_search_params(keyword, category, min_price, max_price)
+
+        cache_key = ("search", params["keyword"], category, min_price, max_price)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            result = self._build_search_result(await self._get(params))
+            self._set_cached(cache_key, result)
+            return result
+        except aiohttp.ClientResponseError as e:
+            logger.error("楽天API呼び出しに失敗しました: %s", e)
+            return {"items": [], "total_count": 0, "page_info": {}, "error": str(e)}
+        except _AIOHTTP_ERRORS as e:
+            logger.error("ネットワークエラー: %s", e)
+            return {"items": [], "total_count": 0, "page_info": {}, "error": str(e)}
+
+    async def search_many(
+        self,
+        keywords: list[str],
+        category: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """複数のキーワードで並行して商品を検索する。
+
+        Args:
+            keywords: 検索キーワードのリスト。
+            category: 楽天カテゴリID。全キーワードに共通で適用。
+            min_price: 最低価格（円）。全キーワードに共通で適用。
+            max_price: 最高価格（円）。全キーワードに共通で適用。
+
+        Returns:
+            keywords と同じ順序の検索結果のリスト。
+            各要素の形式は search と同じ。
+
+        Raises:
+            ValueError: 空のキーワードが含まれる場合、または価格帯の指定が不正な場合。
+
+        Example:
+            >>> results = await skill.search_many(["コーヒー豆", "紅茶"])
+            >>> print([r["total_count"] for r in results])
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.search(keyword, category, min_price, max_price)
+                    for keyword in keywords
+                )
+            )
+        )
+
+    async def compare_prices(self, keyword: str) -> dict[str, Any]:
+        """商品を価格の安い順に比較する（RakutenShoppingSkill.compare_prices の非同期版）。"""
+        params = self._build_compare_params(keyword)
+
+        cache_key = ("compare", params["keyword"])
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            result = self._build_compare_result(await self._get(params))
+            self._set_cached(cache_key, result)
+            return result
+        except aiohttp.ClientResponseError as e:
+            logger.error("価格比較に失敗しました: %s", e)
+            return {
+                "items": [],
+                "lowest_price": 0,
+                "highest_price": 0,
+                "average_price": 0,
+                "total_count": 0,
+                "error": str(e),
+            }
+        except _AIOHTTP_ERRORS as e:
+            logger.error("ネットワークエラー: %s", e)
             return {
-                "item_name": item.get("itemName", ""),
-                "price": price,
-                "base_rate": base_rate,
-                "bonus_rate": bonus_rate,
-                "total_rate": total_rate,
-                "estimated_points": estimated_points,
+                "items": [],
+                "lowest_price": 0,
+                "highest_price": 0,
+                "average_price": 0,
+                "total_count": 0,
+                "error": str(e),
             }
-        except requests.HTTPError as e:
+
+    async def get_point_rate(self, item_code: str) -> dict[str, Any]:
+        """ポイント還元率を取得する（RakutenShoppingSkill.get_point_rate の非同期版）。"""
+        params = self._build_point_rate_params(item_code)
+
+        cache_key = ("point_rate", item_code)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            result = self._build_point_rate_result(await self._get(params))
+            self._set_cached(cache_key, result)
+            return result
+        except aiohttp.ClientResponseError as e:
             logger.error("ポイント情報の取得に失敗しました: %s", e)
             return {
                 "item_name": "",
@@ -318,7 +807,7 @@ class RakutenShoppingSkill:
                 "estimated_points": 0,
                 "error": str(e),
             }
-        except requests.RequestException as e:
+        except _AIOHTTP_ERRORS as e:
             logger.error("ネットワークエラー: %s", e)
             return {
                 "item_name": "",
@@ -4,17 +4,68 @@
 OpenWeatherMap APIを使用。傘リマインダー、洗濯物アラート、熱中症警告に対応。
 """
 
+import bisect
+import copy
+import functools
 import logging
 import os
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Callable, Hashable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any, Optional
 
+import orjson
 import requests
+from cachetools import Cache, LRUCache, TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:  # pragma: no cover - 未導入の環境ではディスクキャッシュを使わない
+    requests_cache = None
 
 logger = logging.getLogger(__name__)
 
 OPENWEATHERMAP_BASE_URL = "https://api.openweathermap.org/data/2.5"
 
+# セッションの接続プールとリトライ設定
+HTTP_POOL_MAXSIZE = 16
+MAX_RETRIES = 2
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# get_forecast_bulk で同時に取得する都市数の上限。1都市あたり2リクエストを
+# 並行して送るため、接続プールの大きさの半分とする。
+BULK_MAX_WORKERS = HTTP_POOL_MAXSIZE // 2
+
+# APIレスポンスのキャッシュ保持時間（秒）。現在の天気は約10分、
+# 5日間予報は3時間ごとに更新される。
+CURRENT_TTL = 600
+FORECAST_TTL = 10800
+CACHE_MAXSIZE = 256
+
+# 存在しない都市名や無効なAPIキーなど、再試行しても結果が変わらない
+# エラーを記録しておく秒数
+NEGATIVE_TTL = 60
+
+# check_umbrella・check_laundry・check_heatstroke の判定結果を再利用する秒数。
+# 天気情報のキャッシュ保持時間がこれより短い場合はそちらに合わせる。
+RESULT_TTL = 300
+
+# リクエスト送信・レスポンス解析で発生し得る例外（HTTPエラーステータスを除く）。
+# orjson はJSONの解析に失敗すると orjson.JSONDecodeError を送出する。
+_REQUEST_ERRORS = (requests.RequestException, orjson.JSONDecodeError)
+
+# 予報の dt（UNIX時間）を日単位に区切るための1日の秒数
+SECONDS_PER_DAY = 86400
+
+# 欠けている項目を参照するときの既定値。呼び出しごとに空の辞書を作らないよう共有する。
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 # 熱中症リスクレベルの閾値
 HEATSTROKE_THRESHOLDS = {
     "safe": {"max_wbgt": 21, "label": "安全", "advice": "特に注意は必要ありません。"},
@@ -40,13 +91,205 @@ HEATSTROKE_THRESHOLDS = {
     },
 }
 
-# 降水に関連する天気コード（OpenWeatherMap）
-RAIN_WEATHER_CODES = {
+# 熱中症リスクレベルを WBGT の昇順に並べた (上限値, ラベル, アドバイス) と、
+# bisect で探索するための境界値（最上位レベルの上限値は使わない）
+_HEATSTROKE_LEVELS = tuple(
+    (level["max_wbgt"], level["label"], level["advice"])
+    for level in sorted(
+        HEATSTROKE_THRESHOLDS.values(), key=lambda level: level["max_wbgt"]
+    )
+)
+_HEATSTROKE_CUTS = tuple(max_wbgt for max_wbgt, _, _ in _HEATSTROKE_LEVELS[:-1])
+
+# 降水に関連する天気コード（OpenWeatherMap）。
+# 整数ビットマップによる判定（(bitmap >> code) & 1）はシフトのたびに多倍長整数を
+# 生成するため、CPython では frozenset の in より遅い。
+RAIN_WEATHER_CODES: frozenset[int] = frozenset({
     200, 201, 202, 210, 211, 212, 221, 230, 231, 232,  # 雷雨
     300, 301, 302, 310, 311, 312, 313, 314, 321,        # 霧雨
     500, 501, 502, 503, 504, 511, 520, 521, 522, 531,   # 雨
     600, 601, 602, 611, 612, 613, 615, 616, 620, 621, 622,  # 雪
-}
+})
+
+
+def _build_http_adapter() -> HTTPAdapter:
+    """接続プールを拡張し、リトライを設定したHTTPAdapterを生成する。
+
+    OpenWeatherMap APIの呼び出しはすべてGETのため、レート制限（429）や
+    一時的なサーバーエラーは指数バックオフで再送する。リトライ上限に
+    達した場合も最後のレスポンスをそのまま返し、呼び出し側の
+    raise_for_status でエラーとして扱う。
+
+    Returns:
+        requests.Session にマウントするHTTPAdapter。
+    """
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=HTTP_POOL_MAXSIZE,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _wbgt_cached(temperature: float, humidity: float) -> float:
+    """WBGT（暑さ指数）の推定式。同じ気温・湿度の組み合わせは計算結果を再利用する。"""
+    return (
+        0.725 * temperature
+        + 0.0368 * humidity
+        + 0.00364 * temperature * humidity
+        - 3.246
+    )
+
+
+def _build_session(
+    cache_name: Optional[str], current_ttl: float, forecast_ttl: float
+) -> requests.Session:
+    """OpenWeatherMap API呼び出し用のセッションを生成する。
+
+    cache_name が指定され requests-cache が利用できる場合は、レスポンスを
+    SQLiteに保存する CachedSession を返す。プロセスを再起動しても有効期間内の
+    天気情報を再利用できる。APIキー（appid）はキャッシュに保存しない。
+
+    Args:
+        cache_name: SQLiteキャッシュのファイル名。None の場合はディスクに保存しない。
+        current_ttl: 現在の天気をキャッシュする秒数。
+        forecast_ttl: 5日間予報をキャッシュする秒数。
+
+    Returns:
+        接続プールとリトライを設定したセッション。
+    """
+    session: requests.Session
+    if cache_name is not None and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            cache_name=cache_name,
+            backend="sqlite",
+            expire_after=current_ttl,
+            urls_expire_after={"*/forecast": forecast_ttl},
+            allowable_methods=("GET",),
+            ignored_parameters=["appid"],
+        )
+    else:
+        if cache_name is not None:
+            logger.warning(
+                "requests-cache が未インストールのため、ディスクキャッシュを使用しません。"
+            )
+        session = requests.Session()
+    session.mount("https://", _build_http_adapter())
+    return session
+
+
+def _cache_result(
+    check: Callable[["WeatherReminderSkill", str], dict[str, Any]],
+) -> Callable[["WeatherReminderSkill", str], dict[str, Any]]:
+    """check_* の判定結果を都市ごとにキャッシュするデコレーター。
+
+    エラーを含む結果はキャッシュしない。
+    """
+
+    @functools.wraps(check)
+    def wrapper(self: "WeatherReminderSkill", city: str) -> dict[str, Any]:
+        cache_key = (check.__name__, city)
+        cached = self._get_cached(self._result_cache, cache_key)
+        if cached is not None:
+            return cached
+
+        result = check(self, city)
+        if "error" not in result:
+            self._set_cached(self._result_cache, cache_key, result)
+        return result
+
+    return wrapper
+
+
+def _weather_signature(forecast: dict[str, Any]) -> Optional[tuple[Any, ...]]:
+    """判定に使う気象値だけを並べたタプルを返す（エラーを含む予報は None）。
+
+    _classify_* が参照する値をすべて含むため、シグネチャが同じ予報に対する
+    判定結果は同じになる。
+    """
+    if "error" in forecast:
+        return None
+    current = forecast.get("current") or _EMPTY
+    daily = forecast.get("daily") or ()
+    return (
+        current.get("weather_code"),
+        current.get("description"),
+        current.get("temperature"),
+        current.get("feels_like"),
+        current.get("humidity"),
+        current.get("wind_speed"),
+        daily[0].get("rain_probability") if daily else None,
+    )
+
+
+def _reuse_classification(
+    classify: Callable[["WeatherReminderSkill", dict[str, Any]], dict[str, Any]],
+) -> Callable[["WeatherReminderSkill", dict[str, Any]], dict[str, Any]]:
+    """気象値が前回と変わらない場合に _classify_* の判定結果を再利用するデコレーター。
+
+    天気情報を取得し直しても値が変わっていなければ、判定処理と結果の
+    辞書の構築を省略する。
+    """
+
+    @functools.wraps(classify)
+    def wrapper(
+        self: "WeatherReminderSkill", forecast: dict[str, Any]
+    ) -> dict[str, Any]:
+        signature = _weather_signature(forecast)
+        if signature is None:
+            return classify(self, forecast)
+
+        cache_key = (classify.__name__, signature)
+        cached = self._get_cached(self._classification_cache, cache_key)
+        if cached is not None:
+            return cached
+
+        result = classify(self, forecast)
+        if "error" not in result:
+            self._set_cached(self._classification_cache, cache_key, result)
+        return result
+
+    return wrapper
+
+
+def _slim_forecast(data: dict[str, Any]) -> dict[str, Any]:
+    """5日間予報のレスポンスから、日別集約で使う項目だけを残す。
+
+    OpenWeatherMap の予報APIは返却項目を指定できないため、キャッシュに
+    保存する前に不要な項目（visibility, clouds, wind, sys など）を取り除く。
+
+    Args:
+        data: OpenWeatherMap APIからの予報データ。
+
+    Returns:
+        各予報の dt, main.temp, weather[0] の id・description, pop のみを
+        含む予報データ。
+    """
+    entries = []
+    for entry in data.get("list", ()):
+        weather = (entry.get("weather") or (_EMPTY,))[0]
+        entries.append(
+            {
+                "dt": entry["dt"],
+                "main": {"temp": (entry.get("main") or _EMPTY).get("temp", 0)},
+                "weather": [
+                    {
+                        "id": weather.get("id", 0),
+                        "description": weather.get("description", ""),
+                    }
+                ],
+                "pop": entry.get("pop", 0),
+            }
+        )
+    return {"list": entries}
 
 
 class WeatherReminderSkill:
@@ -59,12 +302,22 @@ class WeatherReminderSkill:
         api_key: OpenWeatherMap APIキー。
     """
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        current_ttl: float = CURRENT_TTL,
+        forecast_ttl: float = FORECAST_TTL,
+        cache_name: Optional[str] = None,
+    ) -> None:
         """WeatherReminderSkillを初期化する。
 
         Args:
             api_key: OpenWeatherMap APIキー。
                 省略時は環境変数 OPENWEATHERMAP_API_KEY を使用。
+            current_ttl: 現在の天気をキャッシュする秒数。0 でキャッシュ無効。
+            forecast_ttl: 5日間予報をキャッシュする秒数。0 でキャッシュ無効。
+            cache_name: 指定するとAPIレスポンスをこの名前のSQLiteファイルにも
+                保存し、プロセスの再起動後も再利用する（requests-cache が必要）。
 
         Raises:
             ValueError: APIキーが設定されていない場合。
@@ -77,11 +330,114 @@ class WeatherReminderSkill:
                 "OPENWEATHERMAP_API_KEY で指定してください。"
             )
 
-        self._session = requests.Session()
+        self._cache_name = cache_name
+        self._current_ttl = current_ttl
+        self._forecast_ttl = forecast_ttl
+        # 都市名以外のリクエストパラメータは呼び出しによらず共通のため、一度だけ構築する
+        self._base_params: dict[str, Any] = {
+            "appid": self.api_key,
+            "units": "metric",
+            "lang": "ja",
+        }
+        self._current_cache: TTLCache = TTLCache(
+            maxsize=CACHE_MAXSIZE, ttl=current_ttl
+        )
+        self._forecast_cache: TTLCache = TTLCache(
+            maxsize=CACHE_MAXSIZE, ttl=forecast_ttl
+        )
+        self._negative_cache: TTLCache = TTLCache(
+            maxsize=CACHE_MAXSIZE, ttl=NEGATIVE_TTL
+        )
+        self._result_cache: TTLCache = TTLCache(
+            maxsize=CACHE_MAXSIZE, ttl=min(RESULT_TTL, current_ttl, forecast_ttl)
+        )
+        self._classification_cache: LRUCache = LRUCache(maxsize=CACHE_MAXSIZE)
+        self._cache_lock = threading.Lock()
+        self._lazy_session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def _session(self) -> requests.Session:
+        """APIを呼び出すときに初めて生成するセッション。
+
+        WBGTの推定など、通信を伴わない処理だけを使う場合にセッションの
+        生成コストを払わないよう遅延させる。get_forecast は2つのスレッドから
+        同時に参照するため、ロックを取って1つだけ生成する。
+        """
+        session = self._lazy_session
+        if session is not None:
+            return session
+
+        with self._session_lock:
+            if self._lazy_session is None:
+                self._lazy_session = _build_session(
+                    self._cache_name, self._current_ttl, self._forecast_ttl
+                )
+            return self._lazy_session
+
+    def _get_cached(
+        self, cache: Cache, key: Hashable
+    ) -> Optional[dict[str, Any]]:
+        """キャッシュ済みの値のコピーを返す（未登録・期限切れは None）。"""
+        with self._cache_lock:
+            cached = cache.get(key)
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def _set_cached(
+        self, cache: Cache, key: Hashable, data: dict[str, Any]
+    ) -> None:
+        """値のコピーをキャッシュに保存する。"""
+        with self._cache_lock:
+            cache[key] = copy.deepcopy(data)
+
+    def clear_cache(self) -> None:
+        """キャッシュ済みの天気情報をすべて破棄する（ディスクキャッシュを含む）。"""
+        with self._cache_lock:
+            self._current_cache.clear()
+            self._forecast_cache.clear()
+            self._negative_cache.clear()
+            self._result_cache.clear()
+            self._classification_cache.clear()
+        # ディスクキャッシュを使わない場合は、そのためにセッションを生成しない
+        if self._cache_name is not None and requests_cache is not None:
+            session = self._session
+            if isinstance(session, requests_cache.CachedSession):
+                session.cache.clear()
+
+    def _get_json(
+        self, url: str, city: str, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        """GETリクエストを送信し、レスポンスのJSONを返す。
+
+        直前に 4xx エラー（429 を除く）となった都市は、NEGATIVE_TTL 秒間
+        リクエストを送らずに同じエラーを送出する。
+
+        Raises:
+            requests.HTTPError: API呼び出しが失敗した場合。
+            requests.RequestException: ネットワークエラーの場合。
+            orjson.JSONDecodeError: レスポンスがJSONとして解析できない場合。
+        """
+        with self._cache_lock:
+            error_message = self._negative_cache.get(city)
+        if error_message is not None:
+            raise requests.HTTPError(error_message)
+
+        response = self._session.get(url, params=params, timeout=30)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            status = response.status_code
+            if 400 <= status < 500 and status != 429:
+                with self._cache_lock:
+                    self._negative_cache[city] = str(e)
+            raise
+        return orjson.loads(response.content)
 
     def _fetch_current_weather(self, city: str) -> dict[str, Any]:
         """現在の天気情報を取得する。
 
+        取得結果は current_ttl 秒間キャッシュされる。
+
         Args:
             city: 都市名（英語表記）。
 
@@ -91,39 +447,41 @@ class WeatherReminderSkill:
         Raises:
             requests.HTTPError: API呼び出しが失敗した場合。
         """
+        cached = self._get_cached(self._current_cache, city)
+        if cached is not None:
+            return cached
+
         url = f"{OPENWEATHERMAP_BASE_URL}/weather"
-        params = {
-            "q": city,
-            "appid": self.api_key,
-            "units": "metric",
-            "lang": "ja",
-        }
-        response = self._session.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        params = {"q": city, **self._base_params}
+        data = self._get_json(url, city, params)
+        self._set_cached(self._current_cache, city, data)
+        return data
 
     def _fetch_forecast(self, city: str) -> dict[str, Any]:
         """5日間の天気予報を取得する。
 
+        取得結果は forecast_ttl 秒間キャッシュされる。
+
         Args:
             city: 都市名（英語表記）。
 
         Returns:
-            OpenWeatherMap APIからの予報データ。
+            OpenWeatherMap APIからの予報データ（get_forecast が参照する項目のみ）。
 
         Raises:
             requests.HTTPError: API呼び出しが失敗した場合。
         """
+        cached = self._get_cached(self._forecast_cache, city)
+        if cached is not None:
+            return cached
+
         url = f"{OPENWEATHERMAP_BASE_URL}/forecast"
-        params = {
-            "q": city,
-            "appid": self.api_key,
-            "units": "metric",
-            "lang": "ja",
-        }
-        response = self._session.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        # 天気説明は日別予報としてそのまま利用者に表示するため、
+        # _base_params の lang=ja は予報でも外さない
+        params = {"q": city, **self._base_params}
+        data = _slim_forecast(self._get_json(url, city, params))
+        self._set_cached(self._forecast_cache, city, data)
+        return data
 
     def _estimate_wbgt(self, temperature: float, humidity: float) -> float:
         """WBGT（暑さ指数）を気温と湿度から推定する。
@@ -138,7 +496,7 @@ class WeatherReminderSkill:
         Returns:
             推定WBGT値（摂氏）。
         """
-        return 0.725 * temperature + 0.0368 * humidity + 0.00364 * temperature * humidity - 3.246
+        return _wbgt_cached(temperature, humidity)
 
     def get_forecast(self, city: str) -> dict[str, Any]:
         """指定した都市の天気予報を取得する。
@@ -166,58 +524,65 @@ class WeatherReminderSkill:
             raise ValueError("都市名は空にできません。")
 
         try:
-            current_data = self._fetch_current_weather(city)
-            forecast_data = self._fetch_forecast(city)
+            # 現在の天気と5日間予報は互いに独立しているため並行して取得
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                current_future = executor.submit(self._fetch_current_weather, city)
+                forecast_future = executor.submit(self._fetch_forecast, city)
+                current_data = current_future.result()
+                forecast_data = forecast_future.result()
 
-            weather = current_data.get("weather", [{}])[0]
-            main_data = current_data.get("main", {})
+            weather = (current_data.get("weather") or (_EMPTY,))[0]
+            main_data = current_data.get("main") or _EMPTY
+            wind = current_data.get("wind") or _EMPTY
 
             current = {
                 "description": weather.get("description", "不明"),
                 "temperature": main_data.get("temp", 0),
                 "feels_like": main_data.get("feels_like", 0),
                 "humidity": main_data.get("humidity", 0),
-                "wind_speed": current_data.get("wind", {}).get("speed", 0),
+                "wind_speed": wind.get("speed", 0),
                 "weather_code": weather.get("id", 0),
             }
 
-            # 予報データを日別に集約
-            daily_forecasts = {}
+            # 予報データを日別に集約（天気説明は出現回数だけを数える）。
+            # 各予報の項目は _slim_forecast で揃えてあるため直接参照する。
+            # 予報は最大40件と少なく、NumPy 配列への変換と ufunc.at の呼び出し
+            # コストが上回るため、集約は Python のループで行う。
+            # 日付は UTC の通算日（dt // 86400）で区切り、文字列への変換は日ごとに1回だけ行う。
+            daily_forecasts: defaultdict[int, dict[str, Any]] = defaultdict(
+                lambda: {
+                    "temp_min": float("inf"),
+                    "temp_max": float("-inf"),
+                    "descriptions": Counter(),
+                    "rain_probability": 0,
+                }
+            )
             for entry in forecast_data.get("list", []):
-                dt = datetime.fromtimestamp(entry["dt"], tz=timezone.utc)
-                date_key = dt.strftime("%Y-%m-%d")
-
-                if date_key not in daily_forecasts:
-                    daily_forecasts[date_key] = {
-                        "date": date_key,
-                        "temp_min": float("inf"),
-                        "temp_max": float("-inf"),
-                        "descriptions": [],
-                        "weather_codes": [],
-                        "rain_probability": 0,
-                    }
+                day = daily_forecasts[entry["dt"] // SECONDS_PER_DAY]
 
-                day = daily_forecasts[date_key]
-                temp = entry.get("main", {}).get("temp", 0)
-                day["temp_min"] = min(day["temp_min"], temp)
-                day["temp_max"] = max(day["temp_max"], temp)
+                temp = entry["main"]["temp"]
+                if temp < day["temp_min"]:
+                    day["temp_min"] = temp
+                if temp > day["temp_max"]:
+                    day["temp_max"] = temp
 
-                entry_weather = entry.get("weather", [{}])[0]
-                day["descriptions"].append(entry_weather.get("description", ""))
-                day["weather_codes"].append(entry_weather.get("id", 0))
+                day["descriptions"][entry["weather"][0]["description"]] += 1
 
-                pop = entry.get("pop", 0) * 100
-                day["rain_probability"] = max(day["rain_probability"], pop)
+                pop = entry["pop"] * 100
+                if pop > day["rain_probability"]:
+                    day["rain_probability"] = pop
 
             daily = []
-            for date_key in sorted(daily_forecasts.keys()):
-                day = daily_forecasts[date_key]
+            for day_number in sorted(daily_forecasts):
+                day = daily_forecasts[day_number]
+                date_key = datetime.fromtimestamp(
+                    day_number * SECONDS_PER_DAY, tz=timezone.utc
+                ).strftime("%Y-%m-%d")
                 # 最も頻出する天気説明を代表値にする
-                descriptions = day["descriptions"]
-                most_common = max(set(descriptions), key=descriptions.count) if descriptions else "不明"
+                most_common = day["descriptions"].most_common(1)[0][0]
                 daily.append(
                     {
-                        "date": day["date"],
+                        "date": date_key,
                         "description": most_common,
                         "temp_min": round(day["temp_min"], 1),
                         "temp_max": round(day["temp_max"], 1),
@@ -230,10 +595,55 @@ class WeatherReminderSkill:
         except requests.HTTPError as e:
             logger.error("天気予報の取得に失敗しました: city=%s, error=%s", city, e)
             return {"city": city, "current": {}, "daily": [], "error": str(e)}
-        except requests.RequestException as e:
+        except _REQUEST_ERRORS as e:
             logger.error("ネットワークエラー: %s", e)
             return {"city": city, "current": {}, "daily": [], "error": str(e)}
 
+    def get_forecast_bulk(self, cities: list[str]) -> dict[str, dict[str, Any]]:
+        """複数の都市の天気予報を並行して取得する。
+
+        取得結果はキャッシュされるため、続けて各都市の check_* を呼び出しても
+        APIへのリクエストは増えません。
+
+        Args:
+            cities: 都市名（英語表記）のリスト。同じ都市が複数含まれる場合は1回だけ取得する。
+
+        Returns:
+            都市名をキー、get_forecast と同じ形式の天気予報を値とする辞書。
+
+        Raises:
+            ValueError: 空の都市名が含まれる場合。
+
+        Example:
+            >>> forecasts = skill.get_forecast_bulk(["Tokyo", "Osaka"])
+            >>> print(forecasts["Osaka"]["current"]["temperature"])
+        """
+        if not all(cities):
+            raise ValueError("都市名は空にできません。")
+
+        unique_cities = list(dict.fromkeys(cities))
+        if not unique_cities:
+            return {}
+
+        max_workers = min(len(unique_cities), BULK_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(
+                zip(unique_cities, executor.map(self.get_forecast, unique_cities))
+            )
+
+    def _get_forecast_for_check(self, city: str) -> dict[str, Any]:
+        """check_* で使う天気予報を取得する。
+
+        get_forecast が想定外の例外を送出した場合も、エラーを含む
+        get_forecast と同じ形式の辞書を返す。
+        """
+        try:
+            return self.get_forecast(city)
+        except Exception as e:
+            logger.error("天気予報の取得に失敗しました: city=%s, error=%s", city, e)
+            return {"city": city, "current": {}, "daily": [], "error": str(e)}
+
+    @_cache_result
     def check_umbrella(self, city: str) -> dict[str, Any]:
         """傘の必要性を判定する。
 
@@ -261,9 +671,12 @@ class WeatherReminderSkill:
         if not city:
             raise ValueError("都市名は空にできません。")
 
-        try:
-            forecast = self.get_forecast(city)
+        return self._classify_umbrella(self._get_forecast_for_check(city))
 
+    @_reuse_classification
+    def _classify_umbrella(self, forecast: dict[str, Any]) -> dict[str, Any]:
+        """get_forecast の結果から傘の必要性を判定する。"""
+        try:
             if "error" in forecast:
                 return {
                     "needed": False,
@@ -324,6 +737,7 @@ class WeatherReminderSkill:
                 "error": str(e),
             }
 
+    @_cache_result
     def check_laundry(self, city: str) -> dict[str, Any]:
         """洗濯物の外干し適性を判定する。
 
@@ -350,9 +764,12 @@ class WeatherReminderSkill:
         if not city:
             raise ValueError("都市名は空にできません。")
 
-        try:
-            forecast = self.get_forecast(city)
+        return self._classify_laundry(self._get_forecast_for_check(city))
 
+    @_reuse_classification
+    def _classify_laundry(self, forecast: dict[str, Any]) -> dict[str, Any]:
+        """get_forecast の結果から洗濯物の外干し適性を判定する。"""
+        try:
             if "error" in forecast:
                 return {
                     "recommended": False,
@@ -384,12 +801,24 @@ class WeatherReminderSkill:
                     "conditions": conditions,
                 }
 
-            # 乾燥指数を計算（気温、湿度、風速から総合評価）
-            temp_score = min(max((temperature - 5) / 30 * 40, 0), 40)
-            humidity_score = max((100 - humidity) / 100 * 35, 0)
-            wind_score = min(wind_speed / 5 * 25, 25)
+            # 乾燥指数を計算（気温、湿度、風速から総合評価）。
+            # 各スコアの上下限は min()/max() の呼び出しではなく比較で丸める。
+            temp_score = (temperature - 5) / 30 * 40
+            if temp_score < 0:
+                temp_score = 0
+            elif temp_score > 40:
+                temp_score = 40
+            humidity_score = (100 - humidity) / 100 * 35
+            if humidity_score < 0:
+                humidity_score = 0
+            wind_score = wind_speed / 5 * 25
+            if wind_score > 25:
+                wind_score = 25
             drying_index = int(temp_score + humidity_score + wind_score)
-            drying_index = min(max(drying_index, 0), 100)
+            if drying_index < 0:
+                drying_index = 0
+            elif drying_index > 100:
+                drying_index = 100
 
             # 今日の降水確率も考慮
             daily = forecast.get("daily", [])
@@ -434,10 +863,13 @@ class WeatherReminderSkill:
                 "error": str(e),
             }
 
+    @_cache_result
     def check_heatstroke(self, city: str) -> dict[str, Any]:
         """熱中症リスクを判定する。
 
         気温と湿度からWBGT（暑さ指数）を推定し、熱中症リスクレベルを判定します。
+        気象データは get_forecast と共通のため、他の判定と続けて呼び出しても
+        APIへのリクエストは増えません。
         リスクレベルに応じたアドバイスを提供します。
 
         Args:
@@ -460,48 +892,38 @@ class WeatherReminderSkill:
         if not city:
             raise ValueError("都市名は空にできません。")
 
+        return self._classify_heatstroke(self._get_forecast_for_check(city))
+
+    @_reuse_classification
+    def _classify_heatstroke(self, forecast: dict[str, Any]) -> dict[str, Any]:
+        """get_forecast の結果から熱中症リスクを判定する。"""
         try:
-            current_data = self._fetch_current_weather(city)
+            if "error" in forecast:
+                return {
+                    "risk_level": "不明",
+                    "wbgt_estimate": 0,
+                    "advice": "天気情報を取得できませんでした。",
+                    "conditions": {},
+                    "error": forecast["error"],
+                }
 
-            main_data = current_data.get("main", {})
-            temperature = main_data.get("temp", 0)
-            humidity = main_data.get("humidity", 0)
+            current = forecast.get("current", {})
+            temperature = current.get("temperature", 0)
+            humidity = current.get("humidity", 0)
 
             conditions = {
                 "temperature": temperature,
-                "feels_like": main_data.get("feels_like", 0),
+                "feels_like": current.get("feels_like", 0),
                 "humidity": humidity,
             }
 
             wbgt = self._estimate_wbgt(temperature, humidity)
             wbgt = round(wbgt, 1)
 
-            # リスクレベルを判定
-            risk_level = "安全"
-            advice = HEATSTROKE_THRESHOLDS["safe"]["advice"]
-
-            for level_key in ["danger", "severe", "warning", "caution", "safe"]:
-                threshold = HEATSTROKE_THRESHOLDS[level_key]
-                if level_key == "safe" and wbgt < threshold["max_wbgt"]:
-                    risk_level = threshold["label"]
-                    advice = threshold["advice"]
-                    break
-                elif level_key == "danger" and wbgt >= HEATSTROKE_THRESHOLDS["severe"]["max_wbgt"]:
-                    risk_level = threshold["label"]
-                    advice = threshold["advice"]
-                    break
-                elif level_key == "severe" and wbgt >= HEATSTROKE_THRESHOLDS["warning"]["max_wbgt"]:
-                    risk_level = threshold["label"]
-                    advice = threshold["advice"]
-                    break
-                elif level_key == "warning" and wbgt >= HEATSTROKE_THRESHOLDS["caution"]["max_wbgt"]:
-                    risk_level = threshold["label"]
-                    advice = threshold["advice"]
-                    break
-                elif level_key == "caution" and wbgt >= HEATSTROKE_THRESHOLDS["safe"]["max_wbgt"]:
-                    risk_level = threshold["label"]
-                    advice = threshold["advice"]
-                    break
+            # リスクレベルを判定（各レベルの上限値未満であればそのレベル）
+            _, risk_level, advice = _HEATSTROKE_LEVELS[
+                bisect.bisect_right(_HEATSTROKE_CUTS, wbgt)
+            ]
 
             return {
                 "risk_level": risk_level,
@@ -510,21 +932,50 @@ class WeatherReminderSkill:
                 "conditions": conditions,
             }
 
-        except requests.HTTPError as e:
-            logger.error("熱中症リスクの判定に失敗しました: city=%s, error=%s", city, e)
-            return {
-                "risk_level": "不明",
-                "wbgt_estimate": 0,
-                "advice": "天気情報を取得できませんでした。",
-                "conditions": {},
-                "error": str(e),
-            }
-        except requests.RequestException as e:
-            logger.error("ネットワークエラー: %s", e)
+        except Exception as e:
+            logger.error("熱中症リスクの判定に失敗しました: %s", e)
             return {
                 "risk_level": "不明",
                 "wbgt_estimate": 0,
-                "advice": "ネットワークエラーが発生しました。",
+                "advice": "判定に失敗しました。",
                 "conditions": {},
                 "error": str(e),
             }
+
+    @_cache_result
+    def summarize(self, city: str) -> dict[str, Any]:
+        """傘・洗濯物・熱中症の判定をまとめて行う。
+
+        天気予報を1回だけ取得し、check_umbrella・check_laundry・
+        check_heatstroke と同じ判定を行います。
+
+        Args:
+            city: 都市名（英語表記）。
+
+        Returns:
+            判定結果を含む辞書。以下のキーを含む:
+            - umbrella (dict): check_umbrella と同じ形式の判定結果
+            - laundry (dict): check_laundry と同じ形式の判定結果
+            - heatstroke (dict): check_heatstroke と同じ形式の判定結果
+            - error (str): 天気情報を取得できなかった場合のみ
+
+        Raises:
+            ValueError: 都市名が空の場合。
+
+        Example:
+            >>> summary = skill.summarize("Tokyo")
+            >>> print(summary["umbrella"]["reason"])
+            >>> print(summary["heatstroke"]["risk_level"])
+        """
+        if not city:
+            raise ValueError("都市名は空にできません。")
+
+        forecast = self._get_forecast_for_check(city)
+        summary = {
+            "umbrella": self._classify_umbrella(forecast),
+            "laundry": self._classify_laundry(forecast),
+            "heatstroke": self._classify_heatstroke(forecast),
+        }
+        if "error" in forecast:
+            summary["error"] = forecast["error"]
+        return summary